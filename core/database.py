@@ -5,13 +5,178 @@ Handles all data persistence for the Dynamic Island Timer.
 
 import sqlite3
 import os
+import threading
+import queue
+import time
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, date, timedelta
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, asdict
+from typing import List, Optional, Dict, Any, Iterator, Tuple, Callable
+from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+# ============== Schema ==============
+
+SCHEMA_SQL = '''
+    -- Tasks table
+    CREATE TABLE IF NOT EXISTS tasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        completed INTEGER DEFAULT 0,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        completed_at TEXT,
+        total_focus_seconds INTEGER DEFAULT 0
+    );
+    
+    -- Focus sessions table
+    CREATE TABLE IF NOT EXISTS focus_sessions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        task_id INTEGER,
+        start_time TEXT DEFAULT CURRENT_TIMESTAMP,
+        end_time TEXT,
+        duration_seconds INTEGER DEFAULT 0,
+        session_type TEXT DEFAULT 'work',
+        completed INTEGER DEFAULT 0,
+        FOREIGN KEY (task_id) REFERENCES tasks(id)
+    );
+    
+    -- Daily stats table for quick aggregation
+    CREATE TABLE IF NOT EXISTS daily_stats (
+        date TEXT PRIMARY KEY,
+        total_focus_seconds INTEGER DEFAULT 0,
+        sessions_completed INTEGER DEFAULT 0,
+        tasks_completed INTEGER DEFAULT 0
+    );
+    
+    -- Settings table
+    CREATE TABLE IF NOT EXISTS settings (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+    
+    -- Daily goals table
+    CREATE TABLE IF NOT EXISTS daily_goals (
+        date TEXT PRIMARY KEY,
+        target_minutes INTEGER DEFAULT 120,
+        achieved_minutes INTEGER DEFAULT 0
+    );
+    
+    -- Indexes for the hot WHERE / ORDER BY clauses
+    CREATE INDEX IF NOT EXISTS idx_daily_goals_date ON daily_goals(date DESC);
+    CREATE INDEX IF NOT EXISTS idx_tasks_completed_created
+        ON tasks(completed, created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_sessions_task_start
+        ON focus_sessions(task_id, start_time DESC);
+'''
+
+# ============== SQL Statements ==============
+# Kept at module scope so the same SQL text is reused for every call and
+# hits the connection's statement cache.
+
+# RETURNING needs SQLite 3.35+; older builds fall back to lastrowid / a re-select
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+TASK_COLUMNS = 'id, name, completed, created_at, completed_at, total_focus_seconds'
+SESSION_COLUMNS = 'id, task_id, start_time, end_time, duration_seconds, session_type, completed'
+
+SQL_INSERT_TASK = 'INSERT INTO tasks (name, created_at) VALUES (?, ?)' + (
+    ' RETURNING id' if HAS_RETURNING else ''
+)
+SQL_GET_TASK = f'SELECT {TASK_COLUMNS} FROM tasks WHERE id = ?'
+SQL_GET_ALL_TASKS = f'SELECT {TASK_COLUMNS} FROM tasks ORDER BY completed ASC, created_at DESC'
+SQL_GET_PENDING_TASKS = f'SELECT {TASK_COLUMNS} FROM tasks WHERE completed = 0 ORDER BY created_at DESC'
+SQL_UPDATE_TASK = '''
+    UPDATE tasks
+    SET name = ?, completed = ?, completed_at = ?, total_focus_seconds = ?
+    WHERE id = ?
+'''
+SQL_COMPLETE_TASK = 'UPDATE tasks SET completed = 1, completed_at = ? WHERE id = ?'
+SQL_UNCOMPLETE_TASK = 'UPDATE tasks SET completed = 0, completed_at = NULL WHERE id = ?'
+SQL_DELETE_TASK_SESSIONS = 'DELETE FROM focus_sessions WHERE task_id = ?'
+SQL_DELETE_TASK = 'DELETE FROM tasks WHERE id = ?'
+SQL_ADD_FOCUS_TIME = 'UPDATE tasks SET total_focus_seconds = total_focus_seconds + ? WHERE id = ?'
+
+SQL_INSERT_SESSION = '''
+    INSERT INTO focus_sessions (task_id, start_time, session_type)
+    VALUES (?, ?, ?)
+''' + ('RETURNING id' if HAS_RETURNING else '')
+SQL_END_SESSION = '''
+    UPDATE focus_sessions
+    SET end_time = ?, duration_seconds = ?, completed = ?
+    WHERE id = ?
+''' + ('RETURNING task_id, session_type' if HAS_RETURNING else '')
+SQL_GET_SESSION_INFO = 'SELECT task_id, session_type FROM focus_sessions WHERE id = ?'
+SQL_GET_TASK_SESSIONS = f'''
+    SELECT {SESSION_COLUMNS} FROM focus_sessions
+    WHERE task_id = ?
+    ORDER BY start_time DESC
+'''
+
+SQL_ADD_DAILY_TASK = '''
+    INSERT INTO daily_stats (date, tasks_completed)
+    VALUES (?, 1)
+    ON CONFLICT(date) DO UPDATE SET tasks_completed = tasks_completed + 1
+'''
+SQL_ADD_DAILY_SESSION = '''
+    INSERT INTO daily_stats (date, total_focus_seconds, sessions_completed)
+    VALUES (?, ?, ?)
+    ON CONFLICT(date) DO UPDATE SET
+        total_focus_seconds = total_focus_seconds + ?,
+        sessions_completed = sessions_completed + ?
+'''
+SQL_GET_DAILY_STATS_SINCE = '''
+    SELECT date, total_focus_seconds, sessions_completed, tasks_completed
+    FROM daily_stats
+    WHERE date >= ?
+'''
+SQL_GET_DAILY_STATS = '''
+    SELECT date, total_focus_seconds, sessions_completed, tasks_completed
+    FROM daily_stats
+    WHERE date = ?
+'''
+SQL_GET_TOTAL_STATS = '''
+    SELECT
+        COALESCE(SUM(total_focus_seconds), 0) as total_focus,
+        COALESCE(SUM(sessions_completed), 0) as total_sessions,
+        COALESCE(SUM(tasks_completed), 0) as total_tasks
+    FROM daily_stats
+'''
+
+SQL_GET_SETTING = 'SELECT value FROM settings WHERE key = ?'
+SQL_SET_SETTING = '''
+    INSERT INTO settings (key, value) VALUES (?, ?)
+    ON CONFLICT(key) DO UPDATE SET value = ?
+'''
+SQL_GET_ALL_SETTINGS = 'SELECT key, value FROM settings'
+
+SQL_GET_DAILY_GOAL = 'SELECT date, target_minutes, achieved_minutes FROM daily_goals WHERE date = ?'
+SQL_SET_DAILY_GOAL_TARGET = '''
+    INSERT INTO daily_goals (date, target_minutes)
+    VALUES (?, ?)
+    ON CONFLICT(date) DO UPDATE SET target_minutes = ?
+'''
+SQL_ADD_TO_DAILY_GOAL = '''
+    INSERT INTO daily_goals (date, target_minutes, achieved_minutes)
+    VALUES (
+        ?,
+        COALESCE(
+            (SELECT CAST(value AS INTEGER) FROM settings WHERE key = 'daily_goal_minutes'),
+            120
+        ),
+        ?
+    )
+    ON CONFLICT(date) DO UPDATE SET
+        achieved_minutes = achieved_minutes + excluded.achieved_minutes
+'''
+SQL_GET_ACHIEVED_GOAL_DATES = '''
+    SELECT date FROM daily_goals
+    WHERE achieved_minutes >= target_minutes AND date <= ?
+    ORDER BY date DESC
+'''
+
+
+@dataclass(slots=True)
 class Task:
     id: Optional[int] = None
     name: str = ""
@@ -21,10 +186,17 @@ class Task:
     total_focus_seconds: int = 0
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'id': self.id,
+            'name': self.name,
+            'completed': self.completed,
+            'created_at': self.created_at,
+            'completed_at': self.completed_at,
+            'total_focus_seconds': self.total_focus_seconds,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class FocusSession:
     id: Optional[int] = None
     task_id: Optional[int] = None
@@ -35,15 +207,16 @@ class FocusSession:
     completed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyStats:
     date: str
     total_focus_seconds: int = 0
     sessions_completed: int = 0
     tasks_completed: int = 0
+    weekday: Optional[int] = None  # Monday=0, set by get_daily_stats
 
 
-@dataclass 
+@dataclass(slots=True)
 class DailyGoal:
     """Daily focus goal tracking."""
     date: str
@@ -62,9 +235,37 @@ class DailyGoal:
         return self.achieved_minutes >= self.target_minutes
 
 
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """App settings parsed from their stored strings.
+    
+    Frozen because one instance is cached and shared by every reader.
+    """
+    work_duration: int = 25
+    break_duration: int = 5
+    alarm_sound: str = "chime"
+    desktop_only_mode: bool = False
+    search_engine: str = "Google"
+    
+    @classmethod
+    def from_dict(cls, values: Dict[str, str]) -> 'Settings':
+        """Parse a raw key -> string settings dict, falling back to defaults."""
+        defaults = cls()
+        return cls(
+            work_duration=int(values.get('work_duration', defaults.work_duration)),
+            break_duration=int(values.get('break_duration', defaults.break_duration)),
+            alarm_sound=values.get('alarm_sound', defaults.alarm_sound).lower(),
+            desktop_only_mode=values.get('desktop_only_mode', 'false').lower() == 'true',
+            search_engine=values.get('search_engine', defaults.search_engine),
+        )
+
+
 class Database:
     """SQLite database handler for task timer data."""
     
+    FOCUS_FLUSH_INTERVAL = 10.0  # seconds between buffered focus-time writes
+    READER_POOL_SIZE = 4  # read-only connections for concurrent SELECTs
+    
     def __init__(self, db_path: Optional[str] = None):
         if db_path is None:
             # Default to user's app data directory
@@ -74,105 +275,183 @@ class Database:
             db_path = str(db_dir / 'timer_data.db')
         
         self.db_path = db_path
-        self._init_database()
-    
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
-    
-    def _init_database(self):
-        """Initialize database tables."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
         
-        # Tasks table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                completed INTEGER DEFAULT 0,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                completed_at TEXT,
-                total_focus_seconds INTEGER DEFAULT 0
-            )
-        ''')
+        # Single long-lived writer connection. The lock serializes writes
+        # since callers may come from worker threads.
+        self._lock = threading.RLock()
+        # Ident of the thread with an open transaction() on the writer, if any
+        self._tx_thread: Optional[int] = None
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None,
+            cached_statements=128
+        )
+        self._conn.row_factory = sqlite3.Row
         
-        # Focus sessions table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS focus_sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                task_id INTEGER,
-                start_time TEXT DEFAULT CURRENT_TIMESTAMP,
-                end_time TEXT,
-                duration_seconds INTEGER DEFAULT 0,
-                session_type TEXT DEFAULT 'work',
-                completed INTEGER DEFAULT 0,
-                FOREIGN KEY (task_id) REFERENCES tasks(id)
-            )
-        ''')
+        # Short-lived cache for reads the UI polls repeatedly: key -> (expires_at, value)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        # Bumped on every invalidation so a read that raced a write is not stored
+        self._cache_gen = 0
+        self._cache_lock = threading.Lock()
+        # Keys invalidated inside the open transaction, dropped again after it ends
+        self._tx_dirty: set = set()
         
-        # Daily stats table for quick aggregation
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS daily_stats (
-                date TEXT PRIMARY KEY,
-                total_focus_seconds INTEGER DEFAULT 0,
-                sessions_completed INTEGER DEFAULT 0,
-                tasks_completed INTEGER DEFAULT 0
-            )
-        ''')
+        # Pending add_focus_time seconds per task, written out in batches
+        self._focus_buf: Dict[int, int] = defaultdict(int)
+        self._buf_last_flush = time.monotonic()
         
-        # Settings table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT
-            )
-        ''')
+        # Today's ISO date string and the timestamp of the next midnight
+        self._today_cache: Tuple[float, str] = (0.0, "")
         
-        # Daily goals table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS daily_goals (
-                date TEXT PRIMARY KEY,
-                target_minutes INTEGER DEFAULT 120,
-                achieved_minutes INTEGER DEFAULT 0
-            )
-        ''')
+        self._init_database()
         
-        conn.commit()
-        conn.close()
+        # Pool of read-only connections; WAL lets them read while the writer works
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        reader_uri = Path(db_path).resolve().as_uri() + '?mode=ro'
+        for _ in range(self.READER_POOL_SIZE):
+            reader = sqlite3.connect(
+                reader_uri, uri=True, check_same_thread=False,
+                cached_statements=128
+            )
+            reader.row_factory = sqlite3.Row
+            reader.execute('PRAGMA temp_store=MEMORY')
+            reader.execute('PRAGMA cache_size=-8000')
+            reader.execute('PRAGMA mmap_size=268435456')
+            self._readers.put(reader)
+    
+    def close(self):
+        """Flush pending writes and close all database connections."""
+        with self._lock:
+            self.flush_focus_time()
+            self._conn.close()
+        for _ in range(self.READER_POOL_SIZE):
+            self._readers.get().close()
+    
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection from the pool.
+        
+        Inside the calling thread's own transaction() this is the writer
+        connection instead, so the block sees its uncommitted writes.
+        """
+        if self._tx_thread == threading.get_ident():
+            with self._lock:
+                yield self._conn
+            return
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    def _today(self) -> str:
+        """Get today's date as an ISO string, recomputed only after midnight."""
+        now = time.time()
+        expires, today = self._today_cache
+        if now < expires:
+            return today
+        current = date.fromtimestamp(now)
+        midnight = datetime.combine(current + timedelta(days=1), datetime.min.time())
+        today = current.isoformat()
+        self._today_cache = (midnight.timestamp(), today)
+        return today
+    
+    def _cached(self, key: str, ttl: float, fn: Callable[[], Any]) -> Any:
+        """Return a cached value for key, calling fn() to refresh it after ttl seconds."""
+        if self._tx_thread == threading.get_ident():
+            # Uncommitted state must not leak into the shared cache
+            return fn()
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        gen = self._cache_gen
+        value = fn()
+        with self._cache_lock:
+            if gen == self._cache_gen:
+                self._cache[key] = (now + ttl, value)
+        return value
+    
+    def _invalidate(self, *keys: str):
+        """Drop cached values so the next read goes to the database.
+        
+        Inside a transaction the keys are dropped again once it ends, since
+        other threads may re-cache the old rows until the COMMIT lands.
+        """
+        if self._tx_thread == threading.get_ident():
+            self._tx_dirty.update(keys)
+        with self._cache_lock:
+            self._cache_gen += 1
+            for key in keys:
+                self._cache.pop(key, None)
+    
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several write calls into one transaction and a single commit."""
+        with self._tx():
+            yield
+    
+    @contextmanager
+    def _tx(self) -> Iterator[sqlite3.Cursor]:
+        """Run a block of statements as one write transaction.
+        
+        Inside an open transaction() the statements join it instead.
+        """
+        with self._lock:
+            cursor = self._conn.cursor()
+            if self._conn.in_transaction:
+                yield cursor
+                return
+            cursor.execute('BEGIN IMMEDIATE')
+            self._tx_thread = threading.get_ident()
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute('ROLLBACK')
+                raise
+            else:
+                cursor.execute('COMMIT')
+            finally:
+                self._tx_thread = None
+                self._invalidate(*self._tx_dirty)
+                self._tx_dirty.clear()
+    
+    def _init_database(self):
+        """Initialize database tables."""
+        with self._lock:
+            cursor = self._conn.cursor()
+            
+            # WAL lets readers proceed during writes; NORMAL sync is safe
+            # under WAL and avoids an fsync on every autocommit.
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+            cursor.execute('PRAGMA cache_size=-8000')
+            cursor.execute('PRAGMA mmap_size=268435456')
+            
+            cursor.executescript(SCHEMA_SQL)
     
     # ============== Task Operations ==============
     
     def add_task(self, name: str) -> Task:
         """Add a new task and return it with ID."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            'INSERT INTO tasks (name, created_at) VALUES (?, ?)',
-            (name, datetime.now().isoformat())
-        )
-        task_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        now = datetime.now().isoformat()
+        with self._lock:
+            cursor = self._conn.execute(SQL_INSERT_TASK, (name, now))
+            task_id = cursor.fetchone()[0] if HAS_RETURNING else cursor.lastrowid
         
         return Task(
             id=task_id,
             name=name,
             completed=False,
-            created_at=datetime.now().isoformat()
+            created_at=now
         )
     
     def get_task(self, task_id: int) -> Optional[Task]:
         """Get a task by ID."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM tasks WHERE id = ?', (task_id,))
-        row = cursor.fetchone()
-        conn.close()
+        self.flush_focus_time()
+        with self._read() as conn:
+            cursor = conn.execute(SQL_GET_TASK, (task_id,))
+            row = cursor.fetchone()
         
         if row:
             return Task(
@@ -187,16 +466,13 @@ class Database:
     
     def get_all_tasks(self, include_completed: bool = True) -> List[Task]:
         """Get all tasks, optionally filtering out completed ones."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        if include_completed:
-            cursor.execute('SELECT * FROM tasks ORDER BY completed ASC, created_at DESC')
-        else:
-            cursor.execute('SELECT * FROM tasks WHERE completed = 0 ORDER BY created_at DESC')
-        
-        rows = cursor.fetchall()
-        conn.close()
+        self.flush_focus_time()
+        with self._read() as conn:
+            if include_completed:
+                cursor = conn.execute(SQL_GET_ALL_TASKS)
+            else:
+                cursor = conn.execute(SQL_GET_PENDING_TASKS)
+            rows = cursor.fetchall()
         
         return [
             Task(
@@ -212,148 +488,102 @@ class Database:
     
     def update_task(self, task: Task):
         """Update an existing task."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE tasks 
-            SET name = ?, completed = ?, completed_at = ?, total_focus_seconds = ?
-            WHERE id = ?
-        ''', (task.name, int(task.completed), task.completed_at, 
-              task.total_focus_seconds, task.id))
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self.flush_focus_time()
+            self._conn.execute(SQL_UPDATE_TASK, (
+                task.name, int(task.completed), task.completed_at,
+                task.total_focus_seconds, task.id
+            ))
     
     def complete_task(self, task_id: int):
         """Mark a task as completed."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
         now = datetime.now().isoformat()
-        cursor.execute(
-            'UPDATE tasks SET completed = 1, completed_at = ? WHERE id = ?',
-            (now, task_id)
-        )
+        today = self._today()
         
-        # Update daily stats
-        today = date.today().isoformat()
-        cursor.execute('''
-            INSERT INTO daily_stats (date, tasks_completed)
-            VALUES (?, 1)
-            ON CONFLICT(date) DO UPDATE SET tasks_completed = tasks_completed + 1
-        ''', (today,))
-        
-        conn.commit()
-        conn.close()
+        self.flush_focus_time()
+        with self._tx() as cursor:
+            cursor.execute(SQL_COMPLETE_TASK, (now, task_id))
+            
+            # Update daily stats
+            cursor.execute(SQL_ADD_DAILY_TASK, (today,))
+        self._invalidate('today_stats')
     
     def uncomplete_task(self, task_id: int):
         """Mark a task as not completed."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            'UPDATE tasks SET completed = 0, completed_at = NULL WHERE id = ?',
-            (task_id,)
-        )
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(SQL_UNCOMPLETE_TASK, (task_id,))
     
     def delete_task(self, task_id: int):
         """Delete a task and its associated sessions."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM focus_sessions WHERE task_id = ?', (task_id,))
-        cursor.execute('DELETE FROM tasks WHERE id = ?', (task_id,))
-        
-        conn.commit()
-        conn.close()
+        with self._tx() as cursor:
+            self._focus_buf.pop(task_id, None)
+            cursor.execute(SQL_DELETE_TASK_SESSIONS, (task_id,))
+            cursor.execute(SQL_DELETE_TASK, (task_id,))
     
     def add_focus_time(self, task_id: int, seconds: int):
-        """Add focus time to a task."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            'UPDATE tasks SET total_focus_seconds = total_focus_seconds + ? WHERE id = ?',
-            (seconds, task_id)
-        )
-        
-        conn.commit()
-        conn.close()
+        """Add focus time to a task.
+        
+        Time is buffered in memory and written at most every
+        FOCUS_FLUSH_INTERVAL seconds, or when flush_focus_time() is called.
+        """
+        with self._lock:
+            self._focus_buf[task_id] += seconds
+            if time.monotonic() - self._buf_last_flush >= self.FOCUS_FLUSH_INTERVAL:
+                self.flush_focus_time()
+    
+    def flush_focus_time(self):
+        """Write any buffered focus time to the database."""
+        with self._lock:
+            self._buf_last_flush = time.monotonic()
+            if not self._focus_buf:
+                return
+            pending = list(self._focus_buf.items())
+            self._focus_buf.clear()
+            with self._tx() as cursor:
+                cursor.executemany(
+                    SQL_ADD_FOCUS_TIME, [(seconds, task_id) for task_id, seconds in pending]
+                )
     
     # ============== Session Operations ==============
     
     def start_session(self, task_id: Optional[int] = None, session_type: str = "work") -> int:
         """Start a new focus session and return its ID."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO focus_sessions (task_id, start_time, session_type)
-            VALUES (?, ?, ?)
-        ''', (task_id, datetime.now().isoformat(), session_type))
-        
-        session_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
-        return session_id
+        now = datetime.now().isoformat()
+        with self._lock:
+            cursor = self._conn.execute(SQL_INSERT_SESSION, (task_id, now, session_type))
+            return cursor.fetchone()[0] if HAS_RETURNING else cursor.lastrowid
     
     def end_session(self, session_id: int, duration_seconds: int, completed: bool = True):
         """End a focus session."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
         now = datetime.now().isoformat()
-        cursor.execute('''
-            UPDATE focus_sessions 
-            SET end_time = ?, duration_seconds = ?, completed = ?
-            WHERE id = ?
-        ''', (now, duration_seconds, int(completed), session_id))
-        
-        # Get session details
-        cursor.execute('SELECT task_id, session_type FROM focus_sessions WHERE id = ?', (session_id,))
-        row = cursor.fetchone()
         
-        if row and row['session_type'] == 'work':
-            # Update task focus time
-            if row['task_id']:
-                cursor.execute('''
-                    UPDATE tasks 
-                    SET total_focus_seconds = total_focus_seconds + ?
-                    WHERE id = ?
-                ''', (duration_seconds, row['task_id']))
+        self.flush_focus_time()
+        with self._tx() as cursor:
+            cursor.execute(
+                SQL_END_SESSION, (now, duration_seconds, int(completed), session_id)
+            )
+            if not HAS_RETURNING:
+                cursor.execute(SQL_GET_SESSION_INFO, (session_id,))
+            row = cursor.fetchone()
             
-            # Update daily stats
-            today = date.today().isoformat()
-            cursor.execute('''
-                INSERT INTO daily_stats (date, total_focus_seconds, sessions_completed)
-                VALUES (?, ?, ?)
-                ON CONFLICT(date) DO UPDATE SET 
-                    total_focus_seconds = total_focus_seconds + ?,
-                    sessions_completed = sessions_completed + ?
-            ''', (today, duration_seconds, 1 if completed else 0,
-                  duration_seconds, 1 if completed else 0))
-        
-        conn.commit()
-        conn.close()
+            if row and row['session_type'] == 'work':
+                # Update task focus time
+                if row['task_id']:
+                    cursor.execute(SQL_ADD_FOCUS_TIME, (duration_seconds, row['task_id']))
+                
+                # Update daily stats
+                today = self._today()
+                sessions = 1 if completed else 0
+                cursor.execute(SQL_ADD_DAILY_SESSION, (
+                    today, duration_seconds, sessions, duration_seconds, sessions
+                ))
+        self._invalidate('today_stats')
     
     def get_sessions_for_task(self, task_id: int) -> List[FocusSession]:
         """Get all sessions for a task."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM focus_sessions 
-            WHERE task_id = ? 
-            ORDER BY start_time DESC
-        ''', (task_id,))
-        
-        rows = cursor.fetchall()
-        conn.close()
+        with self._read() as conn:
+            cursor = conn.execute(SQL_GET_TASK_SESSIONS, (task_id,))
+            rows = cursor.fetchall()
         
         return [
             FocusSession(
@@ -372,40 +602,42 @@ class Database:
     
     def get_daily_stats(self, days: int = 7) -> List[DailyStats]:
         """Get daily stats for the last N days."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        # Generate date range
+        # Generate date range, oldest first
         today = date.today()
-        dates = [(today - timedelta(days=i)).isoformat() for i in range(days)]
+        days_back = [today - timedelta(days=i) for i in reversed(range(days))]
+        if not days_back:
+            return []
+        
+        with self._read() as conn:
+            cursor = conn.execute(SQL_GET_DAILY_STATS_SINCE, (days_back[0].isoformat(),))
+            rows = cursor.fetchall()
         
+        by_date = {row['date']: row for row in rows}
         stats = []
-        for d in reversed(dates):
-            cursor.execute('SELECT * FROM daily_stats WHERE date = ?', (d,))
-            row = cursor.fetchone()
-            
+        for day in days_back:
+            iso = day.isoformat()
+            row = by_date.get(iso)
             if row:
                 stats.append(DailyStats(
-                    date=row['date'],
+                    date=iso,
                     total_focus_seconds=row['total_focus_seconds'],
                     sessions_completed=row['sessions_completed'],
-                    tasks_completed=row['tasks_completed']
+                    tasks_completed=row['tasks_completed'],
+                    weekday=day.weekday()
                 ))
             else:
-                stats.append(DailyStats(date=d))
-        
-        conn.close()
+                stats.append(DailyStats(date=iso, weekday=day.weekday()))
         return stats
     
     def get_today_stats(self) -> DailyStats:
-        """Get stats for today."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        today = date.today().isoformat()
-        cursor.execute('SELECT * FROM daily_stats WHERE date = ?', (today,))
-        row = cursor.fetchone()
-        conn.close()
+        """Get stats for today (cached briefly, refreshed on writes)."""
+        return self._cached('today_stats', 2.0, self._load_today_stats)
+    
+    def _load_today_stats(self) -> DailyStats:
+        today = self._today()
+        with self._read() as conn:
+            cursor = conn.execute(SQL_GET_DAILY_STATS, (today,))
+            row = cursor.fetchone()
         
         if row:
             return DailyStats(
@@ -418,154 +650,143 @@ class Database:
     
     def get_total_stats(self) -> Dict[str, int]:
         """Get total cumulative stats."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT 
-                COALESCE(SUM(total_focus_seconds), 0) as total_focus,
-                COALESCE(SUM(sessions_completed), 0) as total_sessions,
-                COALESCE(SUM(tasks_completed), 0) as total_tasks
-            FROM daily_stats
-        ''')
-        row = cursor.fetchone()
-        conn.close()
+        with self._read() as conn:
+            # Plain tuples are enough here; skip the sqlite3.Row wrapper
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            total_focus, total_sessions, total_tasks = cursor.execute(
+                SQL_GET_TOTAL_STATS
+            ).fetchone()
         
         return {
-            'total_focus_seconds': row['total_focus'] if row else 0,
-            'total_sessions': row['total_sessions'] if row else 0,
-            'total_tasks': row['total_tasks'] if row else 0
+            'total_focus_seconds': total_focus,
+            'total_sessions': total_sessions,
+            'total_tasks': total_tasks
         }
     
     # ============== Settings Operations ==============
     
     def get_setting(self, key: str, default: str = "") -> str:
         """Get a setting value."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
-        row = cursor.fetchone()
-        conn.close()
+        with self._read() as conn:
+            cursor = conn.execute(SQL_GET_SETTING, (key,))
+            row = cursor.fetchone()
         
         return row['value'] if row else default
     
     def set_setting(self, key: str, value: str):
         """Set a setting value."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO settings (key, value) VALUES (?, ?)
-            ON CONFLICT(key) DO UPDATE SET value = ?
-        ''', (key, value, value))
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute(SQL_SET_SETTING, (key, value, value))
+        self._invalidate('settings', 'typed_settings', 'daily_goal', 'streak')
+    
+    def set_settings(self, values: Dict[str, str]):
+        """Set several settings in one write transaction."""
+        if not values:
+            return
+        with self._tx() as cursor:
+            cursor.executemany(
+                SQL_SET_SETTING, [(key, value, value) for key, value in values.items()]
+            )
+        self._invalidate('settings', 'typed_settings', 'daily_goal', 'streak')
     
     def get_all_settings(self) -> Dict[str, str]:
-        """Get all settings."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT key, value FROM settings')
-        rows = cursor.fetchall()
-        conn.close()
+        """Get all settings (cached briefly, refreshed on writes)."""
+        # Copy so callers can add defaults without touching the cached dict
+        return dict(self._cached('settings', 10.0, self._load_all_settings))
+    
+    def _load_all_settings(self) -> Dict[str, str]:
+        with self._read() as conn:
+            cursor = conn.execute(SQL_GET_ALL_SETTINGS)
+            rows = cursor.fetchall()
         
         return {row['key']: row['value'] for row in rows}
     
+    def get_settings(self) -> Settings:
+        """Get the app settings as a parsed Settings (cached, refreshed on writes)."""
+        return self._cached(
+            'typed_settings', 10.0, lambda: Settings.from_dict(self.get_all_settings())
+        )
+    
     # ============== Daily Goals Operations ==============
     
     def get_daily_goal(self, goal_date: Optional[str] = None) -> DailyGoal:
-        """Get daily goal for a date (defaults to today)."""
-        if goal_date is None:
-            goal_date = date.today().isoformat()
-            
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        """Get daily goal for a date (defaults to today).
         
-        cursor.execute('SELECT * FROM daily_goals WHERE date = ?', (goal_date,))
-        row = cursor.fetchone()
+        Today's goal is cached briefly; other dates always hit the database.
+        """
+        today = self._today()
+        if goal_date is None:
+            goal_date = today
+        if goal_date != today:
+            return self._load_daily_goal(goal_date)
+        return self._cached('daily_goal', 2.0, lambda: self._load_daily_goal(today))
+    
+    def _load_daily_goal(self, goal_date: str) -> DailyGoal:
+        with self._read() as conn:
+            cursor = conn.execute(SQL_GET_DAILY_GOAL, (goal_date,))
+            row = cursor.fetchone()
         
         if row:
-            goal = DailyGoal(
+            return DailyGoal(
                 date=row['date'],
                 target_minutes=row['target_minutes'],
                 achieved_minutes=row['achieved_minutes']
             )
-        else:
-            # Get default goal from settings or use 120 minutes
-            default_target = int(self.get_setting('daily_goal_minutes', '120'))
-            goal = DailyGoal(date=goal_date, target_minutes=default_target)
         
-        conn.close()
-        return goal
+        # Get default goal from settings or use 120 minutes
+        default_target = int(self.get_setting('daily_goal_minutes', '120'))
+        return DailyGoal(date=goal_date, target_minutes=default_target)
     
     def set_daily_goal_target(self, target_minutes: int, goal_date: Optional[str] = None):
         """Set the daily goal target."""
         if goal_date is None:
-            goal_date = date.today().isoformat()
-            
-        conn = self._get_connection()
-        cursor = conn.cursor()
+            goal_date = self._today()
         
-        cursor.execute('''
-            INSERT INTO daily_goals (date, target_minutes)
-            VALUES (?, ?)
-            ON CONFLICT(date) DO UPDATE SET target_minutes = ?
-        ''', (goal_date, target_minutes, target_minutes))
-        
-        # Also save as default for future days
-        self.set_setting('daily_goal_minutes', str(target_minutes))
-        
-        conn.commit()
-        conn.close()
+        with self._tx() as cursor:
+            cursor.execute(
+                SQL_SET_DAILY_GOAL_TARGET, (goal_date, target_minutes, target_minutes)
+            )
+            
+            # Also save as default for future days
+            cursor.execute(
+                SQL_SET_SETTING,
+                ('daily_goal_minutes', str(target_minutes), str(target_minutes))
+            )
+        self._invalidate('settings', 'typed_settings', 'daily_goal', 'streak')
     
     def add_to_daily_goal(self, minutes: int, goal_date: Optional[str] = None):
         """Add achieved minutes to daily goal."""
         if goal_date is None:
-            goal_date = date.today().isoformat()
-            
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        # First ensure the goal exists
-        goal = self.get_daily_goal(goal_date)
+            goal_date = self._today()
         
-        cursor.execute('''
-            INSERT INTO daily_goals (date, target_minutes, achieved_minutes)
-            VALUES (?, ?, ?)
-            ON CONFLICT(date) DO UPDATE SET achieved_minutes = achieved_minutes + ?
-        ''', (goal_date, goal.target_minutes, minutes, minutes))
-        
-        conn.commit()
-        conn.close()
+        # A new row takes its target from the saved default, all in one statement
+        with self._lock:
+            self._conn.execute(SQL_ADD_TO_DAILY_GOAL, (goal_date, minutes))
+        self._invalidate('daily_goal', 'streak')
     
     def get_streak(self) -> int:
         """Get current streak of days where goal was achieved."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        streak = 0
-        current_date = date.today()
-        
-        while True:
-            date_str = current_date.isoformat()
-            cursor.execute('''
-                SELECT achieved_minutes, target_minutes FROM daily_goals 
-                WHERE date = ?
-            ''', (date_str,))
-            row = cursor.fetchone()
-            
-            if row and row['achieved_minutes'] >= row['target_minutes']:
+        return self._cached('streak', 2.0, self._load_streak)
+    
+    def _load_streak(self) -> int:
+        today_iso = self._today()
+        today = date.fromisoformat(today_iso).toordinal()
+        
+        with self._read() as conn:
+            cursor = conn.execute(SQL_GET_ACHIEVED_GOAL_DATES, (today_iso,))
+            # Rows are newest first; stop reading at the first gap instead
+            # of fetching the whole history
+            streak = 0
+            expected = None
+            for row in cursor:
+                day = date.fromisoformat(row['date']).toordinal()
+                if expected is None:
+                    # If today hasn't been achieved yet, the streak can still run through yesterday
+                    expected = today if day == today else today - 1
+                if day != expected:
+                    break
                 streak += 1
-                current_date -= timedelta(days=1)
-            else:
-                # If it's today and we haven't achieved yet, check yesterday
-                if current_date == date.today() and streak == 0:
-                    current_date -= timedelta(days=1)
-                    continue
-                break
+                expected -= 1
         
-        conn.close()
         return streak
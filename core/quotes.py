@@ -7,7 +7,7 @@ import random
 from typing import List, Tuple
 
 # Collection of motivational quotes (quote, author)
-MOTIVATIONAL_QUOTES: List[Tuple[str, str]] = [
+MOTIVATIONAL_QUOTES: Tuple[Tuple[str, str], ...] = (
     ("The secret of getting ahead is getting started.", "Mark Twain"),
     ("It's not that I'm so smart, it's just that I stay with problems longer.", "Albert Einstein"),
     ("Focus on being productive instead of busy.", "Tim Ferriss"),
@@ -48,10 +48,10 @@ MOTIVATIONAL_QUOTES: List[Tuple[str, str]] = [
     ("Stay focused, go after your dreams and keep moving toward your goals.", "LL Cool J"),
     ("Focus is a matter of deciding what things you're not going to do.", "John Carmack"),
     ("Productivity is never an accident.", "Paul J. Meyer"),
-]
+)
 
 # Break-specific quotes (for showing during break time)
-BREAK_QUOTES: List[Tuple[str, str]] = [
+BREAK_QUOTES: Tuple[Tuple[str, str], ...] = (
     ("Rest when you're weary. Refresh and renew yourself.", "Ralph Marston"),
     ("Almost everything will work again if you unplug it for a few minutes, including you.", "Anne Lamott"),
     ("Take rest; a field that has rested gives a bountiful crop.", "Ovid"),
@@ -62,41 +62,49 @@ BREAK_QUOTES: List[Tuple[str, str]] = [
     ("Tension is who you think you should be. Relaxation is who you are.", "Chinese Proverb"),
     ("Give your stress wings and let it fly away.", "Terri Guillemets"),
     ("Rest is not idleness.", "John Lubbock"),
-]
+)
 
 
 class QuoteManager:
     """Manages motivational quotes for the app."""
     
     def __init__(self):
+        # Shuffled decks of indices; each quote is shown once per cycle
+        self._deck: List[int] = []
+        self._break_deck: List[int] = []
         self._last_quote_index = -1
         self._last_break_quote_index = -1
     
+    @staticmethod
+    def _refill(deck: List[int], size: int, last_index: int):
+        """Reshuffle all indices into deck, keeping last_index from being drawn next."""
+        deck[:] = range(size)
+        random.shuffle(deck)
+        # Avoid repeating the same quote across a reshuffle
+        if size > 1 and deck[-1] == last_index:
+            deck[0], deck[-1] = deck[-1], deck[0]
+    
     def get_random_quote(self) -> Tuple[str, str]:
         """Get a random motivational quote. Returns (quote, author)."""
-        index = random.randint(0, len(MOTIVATIONAL_QUOTES) - 1)
-        # Avoid repeating the same quote
-        while index == self._last_quote_index and len(MOTIVATIONAL_QUOTES) > 1:
-            index = random.randint(0, len(MOTIVATIONAL_QUOTES) - 1)
-        self._last_quote_index = index
-        return MOTIVATIONAL_QUOTES[index]
+        if not self._deck:
+            self._refill(self._deck, len(MOTIVATIONAL_QUOTES), self._last_quote_index)
+        self._last_quote_index = self._deck.pop()
+        return MOTIVATIONAL_QUOTES[self._last_quote_index]
     
     def get_break_quote(self) -> Tuple[str, str]:
         """Get a random break-time quote. Returns (quote, author)."""
-        index = random.randint(0, len(BREAK_QUOTES) - 1)
-        # Avoid repeating the same quote
-        while index == self._last_break_quote_index and len(BREAK_QUOTES) > 1:
-            index = random.randint(0, len(BREAK_QUOTES) - 1)
-        self._last_break_quote_index = index
-        return BREAK_QUOTES[index]
+        if not self._break_deck:
+            self._refill(self._break_deck, len(BREAK_QUOTES), self._last_break_quote_index)
+        self._last_break_quote_index = self._break_deck.pop()
+        return BREAK_QUOTES[self._last_break_quote_index]
     
-    def get_all_quotes(self) -> List[Tuple[str, str]]:
+    def get_all_quotes(self) -> Tuple[Tuple[str, str], ...]:
         """Get all motivational quotes."""
-        return MOTIVATIONAL_QUOTES.copy()
+        return MOTIVATIONAL_QUOTES
     
-    def get_all_break_quotes(self) -> List[Tuple[str, str]]:
+    def get_all_break_quotes(self) -> Tuple[Tuple[str, str], ...]:
         """Get all break quotes."""
-        return BREAK_QUOTES.copy()
+        return BREAK_QUOTES
 
 
 # Global instance
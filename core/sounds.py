@@ -5,12 +5,11 @@ Sound manager for notification sounds using pygame.
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 # Try to import pygame for sound
 try:
     import pygame
-    pygame.mixer.init()
     PYGAME_AVAILABLE = True
 except ImportError:
     PYGAME_AVAILABLE = False
@@ -22,18 +21,48 @@ try:
 except ImportError:
     WINSOUND_AVAILABLE = False
 
+# The mixer is initialized lazily, once per process, so importing this
+# module doesn't block on probing the audio device.
+_mixer_inited = False
+
+# Dedicated mixer channels so volume is set on the channel, not per play
+ALARM_CHANNEL = 0
+BREAK_END_CHANNEL = 1
+
+
+def _init_mixer() -> bool:
+    """Initialize pygame's mixer on first use. Returns True if audio is usable."""
+    global _mixer_inited, PYGAME_AVAILABLE
+    if _mixer_inited or not PYGAME_AVAILABLE:
+        return _mixer_inited
+    try:
+        pygame.mixer.init()
+        pygame.mixer.set_reserved(2)
+        _mixer_inited = True
+    except Exception as e:
+        print(f"Failed to initialize audio: {e}")
+        PYGAME_AVAILABLE = False
+    return _mixer_inited
+
 
 class SoundManager:
     """Manages alarm sounds for timer notifications."""
     
-    def __init__(self, sounds_dir: Optional[str] = None):
-        self._sounds_dir = sounds_dir or self._get_default_sounds_dir()
+    def __init__(self, sounds_dir: Optional[Union[str, os.PathLike]] = None):
+        self._sounds_dir = os.fspath(sounds_dir or self._get_default_sounds_dir())
         self._current_sound = "chime"
         self._volume = 0.7
         self._sounds = {}
+        self._alarm_channel = None
+        self._break_end_channel = None
+        self._alarm_volume = None  # volume last applied to the alarm channel
+        self._active_sound = None  # resolved Sound for _current_sound
         
-        if PYGAME_AVAILABLE:
+        if _init_mixer():
+            self._alarm_channel = pygame.mixer.Channel(ALARM_CHANNEL)
+            self._break_end_channel = pygame.mixer.Channel(BREAK_END_CHANNEL)
             self._load_sounds()
+            self._active_sound = self._sounds.get(self._current_sound)
     
     def _get_default_sounds_dir(self) -> str:
         """Get the default sounds directory."""
@@ -48,7 +77,10 @@ class SoundManager:
     
     def _load_sounds(self):
         """Load available sound files."""
-        if not os.path.exists(self._sounds_dir):
+        try:
+            with os.scandir(self._sounds_dir) as entries:
+                available = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
             return
         
         sound_files = {
@@ -59,8 +91,8 @@ class SoundManager:
         }
         
         for name, filename in sound_files.items():
-            filepath = os.path.join(self._sounds_dir, filename)
-            if os.path.exists(filepath):
+            if filename in available:
+                filepath = os.path.join(self._sounds_dir, filename)
                 try:
                     self._sounds[name] = pygame.mixer.Sound(filepath)
                 except Exception as e:
@@ -69,6 +101,7 @@ class SoundManager:
     def set_sound(self, sound_name: str):
         """Set the current alarm sound."""
         self._current_sound = sound_name.lower()
+        self._active_sound = self._sounds.get(self._current_sound)
     
     def set_volume(self, volume: float):
         """Set volume (0.0 to 1.0)."""
@@ -76,11 +109,12 @@ class SoundManager:
     
     def play_alarm(self):
         """Play the current alarm sound."""
-        if PYGAME_AVAILABLE and self._current_sound in self._sounds:
+        if self._active_sound is not None:
             try:
-                sound = self._sounds[self._current_sound]
-                sound.set_volume(self._volume)
-                sound.play()
+                if self._alarm_volume != self._volume:
+                    self._alarm_channel.set_volume(self._volume)
+                    self._alarm_volume = self._volume
+                self._alarm_channel.play(self._active_sound)
                 return
             except Exception as e:
                 print(f"Failed to play sound: {e}")
@@ -99,9 +133,8 @@ class SoundManager:
         """Play break end sound (gentler)."""
         if PYGAME_AVAILABLE and 'gentle' in self._sounds:
             try:
-                sound = self._sounds['gentle']
-                sound.set_volume(self._volume * 0.7)
-                sound.play()
+                self._break_end_channel.set_volume(self._volume * 0.7)
+                self._break_end_channel.play(self._sounds['gentle'])
                 return
             except Exception:
                 pass
@@ -116,7 +149,7 @@ class SoundManager:
     
     def stop(self):
         """Stop any playing sounds."""
-        if PYGAME_AVAILABLE:
+        if _mixer_inited:
             try:
                 pygame.mixer.stop()
             except Exception:
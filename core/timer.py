@@ -3,22 +3,53 @@ Timer logic module for Pomodoro timer functionality.
 Uses Qt signals for non-blocking timer updates.
 """
 
-from PySide6.QtCore import QObject, Signal, QTimer
-from enum import Enum
-from dataclasses import dataclass
-from typing import Optional
+from PySide6.QtCore import QObject, Signal, QTimer, Qt
+from enum import IntFlag
+from dataclasses import dataclass, replace
+from typing import Optional, NamedTuple
+import math
 import time
 
 
-class TimerState(Enum):
-    IDLE = "idle"
-    RUNNING = "running"
-    PAUSED = "paused"
-    BREAK = "break"
-    BREAK_PAUSED = "break_paused"
+# Preformatted "MM:SS" strings for every second up to 100 minutes
+_MMSS = tuple(f"{s // 60:02d}:{s % 60:02d}" for s in range(100 * 60 + 1))
 
 
-@dataclass
+class TimerState(IntFlag):
+    IDLE = 1
+    RUNNING = 2
+    PAUSED = 4
+    BREAK = 8
+    BREAK_PAUSED = 16
+
+    @property
+    def label(self) -> str:
+        """Stable string name for serialization."""
+        return _STATE_LABELS[self]
+
+
+_STATE_LABELS = {
+    TimerState.IDLE: "idle",
+    TimerState.RUNNING: "running",
+    TimerState.PAUSED: "paused",
+    TimerState.BREAK: "break",
+    TimerState.BREAK_PAUSED: "break_paused",
+}
+
+# Test membership with a single `&` instead of a tuple lookup
+RUNNING_MASK = TimerState.RUNNING | TimerState.BREAK
+BREAK_MASK = TimerState.BREAK | TimerState.BREAK_PAUSED
+
+
+class TickPayload(NamedTuple):
+    """Everything a UI needs for one tick, computed once per emission."""
+    remaining: int  # seconds left
+    mmss: str  # remaining time as "MM:SS"
+    permille: int  # progress, 0 to 1000
+    state: TimerState
+
+
+@dataclass(slots=True, frozen=True)
 class TimerConfig:
     work_duration: int = 25 * 60  # 25 minutes in seconds
     short_break: int = 5 * 60     # 5 minutes
@@ -26,6 +57,44 @@ class TimerConfig:
     sessions_before_long_break: int = 4
 
 
+class _GlobalTicker(QObject):
+    """
+    Process-wide 1 Hz ticker shared by all PomodoroTimer instances.
+    The underlying QTimer only runs while at least one timer is subscribed.
+    """
+    
+    tick = Signal()
+    _instance: Optional["_GlobalTicker"] = None
+    
+    def __init__(self):
+        super().__init__()
+        self._subscribers = 0
+        self._qt_timer = QTimer(self)
+        self._qt_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._qt_timer.setInterval(1000)
+        self._qt_timer.timeout.connect(self.tick.emit)
+    
+    @classmethod
+    def instance(cls) -> "_GlobalTicker":
+        # Created lazily so it's constructed after the QApplication
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def subscribe(self, slot):
+        self.tick.connect(slot)
+        self._subscribers += 1
+        if self._subscribers == 1:
+            # (Re)starting here aligns ticks with the first subscriber's deadline
+            self._qt_timer.start()
+    
+    def unsubscribe(self, slot):
+        self.tick.disconnect(slot)
+        self._subscribers -= 1
+        if self._subscribers == 0:
+            self._qt_timer.stop()
+
+
 class PomodoroTimer(QObject):
     """
     Non-blocking Pomodoro timer using Qt's event loop.
@@ -33,8 +102,9 @@ class PomodoroTimer(QObject):
     """
     
     # Signals for UI updates
-    tick = Signal(int)  # Emits remaining seconds
-    state_changed = Signal(TimerState)
+    tick = Signal(object)  # Emits a TickPayload
+    progress_changed = Signal(int)  # Emits progress as 0-100 percent
+    state_changed = Signal(object)  # TimerState; object keeps the IntFlag type across the connection
     session_completed = Signal(int)  # Emits total sessions completed
     break_completed = Signal()
     timer_finished = Signal()  # Emits when work session ends
@@ -44,14 +114,26 @@ class PomodoroTimer(QObject):
         self.config = config or TimerConfig()
         self._state = TimerState.IDLE
         self._remaining_seconds = self.config.work_duration
+        self._current_total = self.config.work_duration  # length of the current session
         self._sessions_completed = 0
+        self._next_break_is_long = False  # decided once per work/break boundary
         self._current_task_id: Optional[int] = None
-        self._session_start_time: Optional[float] = None
+        # Monotonic start for measuring durations; epoch start only for display
+        self._session_start_ns: Optional[int] = None
+        self._session_start_epoch: Optional[float] = None
         
-        # Qt Timer for non-blocking updates (1 second interval)
-        self._qt_timer = QTimer(self)
-        self._qt_timer.setInterval(1000)
-        self._qt_timer.timeout.connect(self._on_tick)
+        # Last values sent to listeners, so identical updates are skipped
+        self._last_emitted_seconds: Optional[int] = None
+        self._last_emitted_progress_pct: Optional[int] = None
+        self._last_emitted_state: Optional[TimerState] = None
+        self._emit_pending = False  # a deferred tick is queued by a setter
+        
+        # Monotonic time at which the running countdown reaches zero; the
+        # remaining time is derived from it so missed ticks don't add drift
+        self._deadline: Optional[float] = None
+        
+        # Subscribed to the shared 1 Hz ticker only while counting down
+        self._ticking = False
     
     @property
     def state(self) -> TimerState:
@@ -63,6 +145,8 @@ class PomodoroTimer(QObject):
     
     @property
     def remaining_formatted(self) -> str:
+        if self._remaining_seconds < len(_MMSS):
+            return _MMSS[self._remaining_seconds]
         minutes = self._remaining_seconds // 60
         seconds = self._remaining_seconds % 60
         return f"{minutes:02d}:{seconds:02d}"
@@ -70,11 +154,23 @@ class PomodoroTimer(QObject):
     @property
     def progress(self) -> float:
         """Returns progress as 0.0 to 1.0"""
-        if self._state in (TimerState.BREAK, TimerState.BREAK_PAUSED):
-            total = self._get_break_duration()
-        else:
-            total = self.config.work_duration
-        return 1.0 - (self._remaining_seconds / total) if total > 0 else 0.0
+        if self._current_total <= 0:
+            return 0.0
+        return 1.0 - self._remaining_seconds / self._current_total
+    
+    @property
+    def progress_permille(self) -> int:
+        """Returns progress as 0 to 1000, for integer-only UI paths."""
+        if self._current_total <= 0:
+            return 0
+        return (self._current_total - self._remaining_seconds) * 1000 // self._current_total
+    
+    @property
+    def elapsed_wall_seconds(self) -> float:
+        """Real time since the work session started, including pauses."""
+        if self._session_start_ns is None:
+            return 0.0
+        return (time.monotonic_ns() - self._session_start_ns) / 1e9
     
     @property
     def sessions_completed(self) -> int:
@@ -82,11 +178,11 @@ class PomodoroTimer(QObject):
     
     @property
     def is_running(self) -> bool:
-        return self._state in (TimerState.RUNNING, TimerState.BREAK)
+        return bool(self._state & RUNNING_MASK)
     
     @property
     def is_break(self) -> bool:
-        return self._state in (TimerState.BREAK, TimerState.BREAK_PAUSED)
+        return bool(self._state & BREAK_MASK)
     
     def set_task(self, task_id: Optional[int]):
         """Set the current task for this timer session."""
@@ -99,15 +195,19 @@ class PomodoroTimer(QObject):
         """Start or resume the timer."""
         if self._state == TimerState.IDLE:
             self._remaining_seconds = self.config.work_duration
+            self._current_total = self._remaining_seconds
             self._state = TimerState.RUNNING
-            self._session_start_time = time.time()
+            self._session_start_ns = time.monotonic_ns()
+            self._session_start_epoch = time.time()
         elif self._state == TimerState.PAUSED:
             self._state = TimerState.RUNNING
         elif self._state == TimerState.BREAK_PAUSED:
             self._state = TimerState.BREAK
         
-        self._qt_timer.start()
-        self.state_changed.emit(self._state)
+        if self._deadline is None:
+            self._deadline = time.monotonic() + self._remaining_seconds
+        self._start_ticking()
+        self._emit_state()
     
     def pause(self):
         """Pause the timer."""
@@ -116,8 +216,11 @@ class PomodoroTimer(QObject):
         elif self._state == TimerState.BREAK:
             self._state = TimerState.BREAK_PAUSED
         
-        self._qt_timer.stop()
-        self.state_changed.emit(self._state)
+        self._stop_ticking()
+        if self._deadline is not None:
+            self._remaining_seconds = self._seconds_until_deadline()
+            self._deadline = None
+        self._emit_state()
     
     def toggle(self):
         """Toggle between running and paused states."""
@@ -128,58 +231,115 @@ class PomodoroTimer(QObject):
     
     def reset(self):
         """Reset timer to initial state."""
-        self._qt_timer.stop()
+        self._stop_ticking()
+        self._deadline = None
         self._state = TimerState.IDLE
         self._remaining_seconds = self.config.work_duration
-        self._session_start_time = None
-        self.state_changed.emit(self._state)
-        self.tick.emit(self._remaining_seconds)
+        self._current_total = self._remaining_seconds
+        self._session_start_ns = None
+        self._session_start_epoch = None
+        self._emit_state()
+        self._emit_tick()
     
     def skip_to_break(self):
         """Skip current work session and start break."""
-        self._qt_timer.stop()
+        self._stop_ticking()
         self._start_break()
     
     def skip_break(self):
         """Skip break and start new work session."""
-        self._qt_timer.stop()
+        self._stop_ticking()
+        self._deadline = None
         self._state = TimerState.IDLE
         self._remaining_seconds = self.config.work_duration
-        self.state_changed.emit(self._state)
-        self.tick.emit(self._remaining_seconds)
+        self._current_total = self._remaining_seconds
+        self._emit_state()
+        self._emit_tick()
     
     def set_work_duration(self, minutes: int):
         """Set work duration in minutes."""
-        self.config.work_duration = minutes * 60
+        self.config = replace(self.config, work_duration=minutes * 60)
         if self._state == TimerState.IDLE:
             self._remaining_seconds = self.config.work_duration
-            self.tick.emit(self._remaining_seconds)
+            self._current_total = self._remaining_seconds
+        self._schedule_emit()
     
     def set_break_duration(self, minutes: int):
         """Set short break duration in minutes."""
-        self.config.short_break = minutes * 60
+        self.config = replace(self.config, short_break=minutes * 60)
+        self._schedule_emit()
     
     def set_long_break_duration(self, minutes: int):
         """Set long break duration in minutes."""
-        self.config.long_break = minutes * 60
+        self.config = replace(self.config, long_break=minutes * 60)
+        self._schedule_emit()
+    
+    def _schedule_emit(self):
+        """Coalesce a burst of setter calls into one tick on the next event loop pass."""
+        if not self._emit_pending:
+            self._emit_pending = True
+            QTimer.singleShot(0, self._flush_emit)
+    
+    def _flush_emit(self):
+        self._emit_pending = False
+        self._emit_tick()
     
     def get_elapsed_seconds(self) -> int:
         """Get elapsed seconds in current session."""
-        if self._state in (TimerState.BREAK, TimerState.BREAK_PAUSED):
-            total = self._get_break_duration()
-        else:
-            total = self.config.work_duration
-        return total - self._remaining_seconds
+        return self._current_total - self._remaining_seconds
+    
+    def _start_ticking(self):
+        if not self._ticking:
+            self._ticking = True
+            _GlobalTicker.instance().subscribe(self._on_tick)
+    
+    def _stop_ticking(self):
+        if self._ticking:
+            self._ticking = False
+            _GlobalTicker.instance().unsubscribe(self._on_tick)
+    
+    def _seconds_until_deadline(self) -> int:
+        return max(0, math.ceil(self._deadline - time.monotonic()))
     
     def _on_tick(self):
         """Called every second by Qt timer."""
-        if self._remaining_seconds > 0:
-            self._remaining_seconds -= 1
-            self.tick.emit(self._remaining_seconds)
-        else:
-            self._qt_timer.stop()
+        if self._deadline is None:
+            return
+        remaining = self._seconds_until_deadline()
+        if remaining != self._remaining_seconds:
+            self._remaining_seconds = remaining
+            self._emit_tick()
+        if remaining == 0:
+            self._stop_ticking()
+            self._deadline = None
             self._handle_timer_complete()
     
+    def _emit_tick(self):
+        """Emit tick/progress_changed, skipping values listeners already have."""
+        if self._remaining_seconds != self._last_emitted_seconds:
+            self._last_emitted_seconds = self._remaining_seconds
+            self.tick.emit(TickPayload(
+                self._remaining_seconds,
+                self.remaining_formatted,
+                self.progress_permille,
+                self._state
+            ))
+        
+        progress_pct = int(self.progress * 100)
+        if progress_pct != self._last_emitted_progress_pct:
+            self._last_emitted_progress_pct = progress_pct
+            self.progress_changed.emit(progress_pct)
+    
+    def _emit_state(self):
+        """Emit state_changed only when the state actually changed."""
+        if self._state == self._last_emitted_state:
+            return
+        self._last_emitted_state = self._state
+        # The same seconds mean something else in the new state, so resend them
+        self._last_emitted_seconds = None
+        self._last_emitted_progress_pct = None
+        self.state_changed.emit(self._state)
+    
     def _handle_timer_complete(self):
         """Handle timer completion for work/break sessions."""
         if self._state == TimerState.RUNNING:
@@ -193,19 +353,23 @@ class PomodoroTimer(QObject):
             self.break_completed.emit()
             self._state = TimerState.IDLE
             self._remaining_seconds = self.config.work_duration
-            self.state_changed.emit(self._state)
-            self.tick.emit(self._remaining_seconds)
+            self._current_total = self._remaining_seconds
+            self._emit_state()
+            self._emit_tick()
     
     def _start_break(self):
         """Start break timer."""
+        self._next_break_is_long = (
+            self._sessions_completed % self.config.sessions_before_long_break == 0
+        )
         self._remaining_seconds = self._get_break_duration()
+        self._current_total = self._remaining_seconds
         self._state = TimerState.BREAK
-        self._qt_timer.start()
-        self.state_changed.emit(self._state)
-        self.tick.emit(self._remaining_seconds)
+        self._deadline = time.monotonic() + self._remaining_seconds
+        self._start_ticking()
+        self._emit_state()
+        self._emit_tick()
     
     def _get_break_duration(self) -> int:
         """Get break duration based on sessions completed."""
-        if self._sessions_completed % self.config.sessions_before_long_break == 0:
-            return self.config.long_break
-        return self.config.short_break
+        return self.config.long_break if self._next_break_is_long else self.config.short_break
@@ -3,14 +3,75 @@ Weather service for fetching current weather data.
 Uses wttr.in free API (no API key required).
 """
 
+import array
+import asyncio
+import gzip
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
 import urllib.request
 import json
-from typing import Optional, Dict
-from dataclasses import dataclass
-from PySide6.QtCore import QObject, Signal, QThread
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, NamedTuple, Tuple
+from dataclasses import dataclass, asdict
+from PySide6.QtCore import QObject, Signal, QStandardPaths
 
+# aiohttp gives us a persistent keep-alive session; fall back to urllib without it
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
 
-@dataclass
+# orjson parses straight from bytes and is several times faster than json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+REQUEST_TIMEOUT = 10  # seconds
+REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0', 'Accept-Encoding': 'gzip'}
+
+# wttr.in API - free, no key needed
+_WTTR_BASE = "https://wttr.in/"
+_WTTR_SUFFIX = "?format=j1"
+
+DEFAULT_CACHE_TTL = 10 * 60  # seconds; weather rarely changes faster than this
+CACHE_FILENAME = 'weather_cache.json'
+
+
+# wttr.in weather codes grouped by icon
+_ICON_GROUPS = (
+    ((113,), "☀️"),  # Clear/Sunny
+    ((116, 119), "⛅"),  # Partly cloudy, Cloudy
+    ((122,), "☁️"),  # Overcast
+    ((143, 248, 260), "🌫️"),  # Fog/Mist
+    ((176, 263, 266, 293, 296, 299, 302, 305, 308, 311, 314, 353, 356, 359), "🌧️"),  # Rain
+    ((179, 182, 185, 281, 284, 317, 320, 350, 362, 365, 374, 377), "🌨️"),  # Sleet/Ice
+    ((200, 386, 389, 392, 395), "⛈️"),  # Thunder
+    ((227, 230, 323, 326, 329, 332, 335, 338, 368, 371), "❄️"),  # Snow
+)
+DEFAULT_WEATHER_ICON = "🌤️"
+
+# Codes are bounded (< 400), so a flat byte table indexes straight into the icon tuple
+_ICONS: Tuple[str, ...] = tuple(icon for _, icon in _ICON_GROUPS) + (DEFAULT_WEATHER_ICON,)
+_DEFAULT_ICON_IDX = len(_ICONS) - 1
+_ICON_IDX = array.array('B', [_DEFAULT_ICON_IDX] * 400)
+for _group_id, (_codes, _) in enumerate(_ICON_GROUPS):
+    for _code in _codes:
+        _ICON_IDX[_code] = _group_id
+del _group_id, _codes, _code
+
+
+def get_weather_icon(code: int) -> str:
+    """Map weather code to emoji icon."""
+    return _ICONS[_ICON_IDX[code]] if 0 <= code < 400 else DEFAULT_WEATHER_ICON
+
+
+@dataclass(slots=True, frozen=True)
 class WeatherData:
     """Weather data structure."""
     temp_c: int
@@ -20,108 +81,276 @@ class WeatherData:
     location: str
     humidity: int
     wind_kph: float
-    
-    @property
-    def display_temp(self) -> str:
-        return f"{self.temp_c}°C"
-    
-    @property
-    def display_condition(self) -> str:
-        return self.condition
+    # Display strings, formatted once when the data is parsed
+    display_temp: str
+    display_condition: str
 
 
-class WeatherWorker(QThread):
-    """Background worker for fetching weather."""
-    
-    finished = Signal(object)  # WeatherData or None
-    error = Signal(str)
+class FetchResult(NamedTuple):
+    """Outcome of one fetch. weather is None when the server answered 304."""
+    location: str
+    weather: Optional[WeatherData]
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class WeatherWorker:
+    """Fetches and parses weather on the WeatherService event loop."""
     
-    def __init__(self, location: str = ""):
-        super().__init__()
-        self.location = location
+    def __init__(self):
+        self._session: Optional["aiohttp.ClientSession"] = None
+        # Small fixed pool for blocking urllib fetches when aiohttp is missing
+        self._executor: Optional[ThreadPoolExecutor] = None
     
-    def run(self):
-        try:
-            # Use wttr.in API - free, no key needed
-            url = f"https://wttr.in/{self.location}?format=j1"
-            
-            req = urllib.request.Request(
-                url,
-                headers={'User-Agent': 'Mozilla/5.0'}
+    async def fetch(self, location: str = "", etag: Optional[str] = None,
+                    last_modified: Optional[str] = None) -> FetchResult:
+        """Fetch current weather for a location (empty for auto-detect).
+        
+        Passing the etag/last_modified of a cached response makes this a
+        conditional GET; an unchanged response comes back with weather=None.
+        """
+        # Quote the location so spaces/unicode don't produce a bad request
+        url = _WTTR_BASE + urllib.parse.quote(location, safe='') + _WTTR_SUFFIX
+        
+        # Only allocate per-request headers for a conditional GET
+        headers = None
+        if etag or last_modified:
+            headers = {}
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        if AIOHTTP_AVAILABLE:
+            session = self._get_session()
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    return FetchResult(location, None, etag, last_modified)
+                response.raise_for_status()
+                data = _json_loads(await response.read())
+                response_headers = response.headers
+        else:
+            loop = asyncio.get_running_loop()
+            status, response_headers, data = await loop.run_in_executor(
+                self._get_executor(), self._fetch_blocking, url, headers
             )
-            
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
-            
-            current = data['current_condition'][0]
-            area = data['nearest_area'][0]
-            
-            # Map weather codes to simple icons
-            code = int(current.get('weatherCode', 113))
-            icon = self._get_weather_icon(code)
-            
-            weather = WeatherData(
-                temp_c=int(current['temp_C']),
-                temp_f=int(current['temp_F']),
-                condition=current['weatherDesc'][0]['value'],
-                icon=icon,
-                location=area['areaName'][0]['value'],
-                humidity=int(current['humidity']),
-                wind_kph=float(current['windspeedKmph'])
+            if status == 304:
+                return FetchResult(location, None, etag, last_modified)
+        
+        return FetchResult(
+            location,
+            self._parse(data),
+            response_headers.get('ETag'),
+            response_headers.get('Last-Modified')
+        )
+    
+    async def close(self):
+        """Close the HTTP session and fallback thread pool."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="weather-fetch")
+        return self._executor
+    
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Create the shared session lazily, on the event loop thread."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                headers=REQUEST_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+                connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
             )
-            
-            self.finished.emit(weather)
-            
-        except Exception as e:
-            self.error.emit(str(e))
-            self.finished.emit(None)
-    
-    def _get_weather_icon(self, code: int) -> str:
-        """Map weather code to emoji icon."""
-        # wttr.in weather codes
-        if code == 113:  # Clear/Sunny
-            return "☀️"
-        elif code in [116, 119]:  # Partly cloudy, Cloudy
-            return "⛅"
-        elif code == 122:  # Overcast
-            return "☁️"
-        elif code in [143, 248, 260]:  # Fog/Mist
-            return "🌫️"
-        elif code in [176, 263, 266, 293, 296, 299, 302, 305, 308, 311, 314, 353, 356, 359]:  # Rain
-            return "🌧️"
-        elif code in [179, 182, 185, 281, 284, 317, 320, 350, 362, 365, 374, 377]:  # Sleet/Ice
-            return "🌨️"
-        elif code in [200, 386, 389, 392, 395]:  # Thunder
-            return "⛈️"
-        elif code in [227, 230, 323, 326, 329, 332, 335, 338, 368, 371]:  # Snow
-            return "❄️"
-        else:
-            return "🌤️"
+        return self._session
+    
+    @staticmethod
+    def _fetch_blocking(url: str, headers: Optional[Dict[str, str]]) -> Tuple[int, Any, Optional[Dict[str, Any]]]:
+        """Fetch JSON with urllib (used when aiohttp is not installed).
+        
+        Returns (status, headers, data); data is None for a 304.
+        """
+        req = urllib.request.Request(
+            url, headers={**REQUEST_HEADERS, **headers} if headers else REQUEST_HEADERS
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as response:
+                body = response.read()
+                if response.headers.get('Content-Encoding') == 'gzip':
+                    body = gzip.decompress(body)
+                return response.status, response.headers, _json_loads(body)
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return 304, e.headers, None
+            raise
+    
+    def _parse(self, data: Dict[str, Any]) -> WeatherData:
+        """Build WeatherData from a wttr.in j1 response."""
+        current = data['current_condition'][0]
+        area = data['nearest_area'][0]
+        
+        # Map weather codes to simple icons
+        code = int(current.get('weatherCode', 113))
+        icon = get_weather_icon(code)
+        
+        temp_c = int(current['temp_C'])
+        condition = current['weatherDesc'][0]['value']
+        return WeatherData(
+            temp_c=temp_c,
+            temp_f=int(current['temp_F']),
+            condition=condition,
+            icon=icon,
+            location=area['areaName'][0]['value'],
+            humidity=int(current['humidity']),
+            wind_kph=float(current['windspeedKmph']),
+            display_temp=f"{temp_c}°C",
+            display_condition=condition
+        )
 
 
 class WeatherService(QObject):
-    """Service for managing weather data fetching."""
+    """Service for managing weather data fetching.
+    
+    Requests run on an asyncio loop in a background thread, so several
+    fetches can overlap without a thread each. Results are cached per
+    location for a TTL and persisted to disk; stale entries are
+    revalidated with a conditional GET.
+    """
     
     weather_updated = Signal(object)  # WeatherData
+    _fetched = Signal(object)  # internal: FetchResult delivered from the loop thread
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, ttl: int = DEFAULT_CACHE_TTL):
         super().__init__(parent)
-        self._worker: Optional[WeatherWorker] = None
+        self._worker = WeatherWorker()
         self._last_weather: Optional[WeatherData] = None
+        self._pending: Dict[str, Future] = {}
+        self._ttl = ttl
+        
+        # location -> (fetched_at, weather, etag, last_modified)
+        self._cache: Dict[str, Tuple[float, WeatherData, Optional[str], Optional[str]]] = {}
+        self._cache_path = os.path.join(
+            QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation),
+            CACHE_FILENAME
+        )
+        self._load_cache()
+        
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="weather-loop", daemon=True
+        )
+        self._thread.start()
+        
+        # Queued across threads, so the slot runs on the Qt thread
+        self._fetched.connect(self._on_weather_fetched)
+    
+    def set_ttl(self, seconds: int):
+        """Set how long fetched weather is reused (e.g. 5/10/15/30 minutes)."""
+        self._ttl = max(0, seconds)
     
     def fetch_weather(self, location: str = ""):
-        """Start fetching weather data."""
-        if self._worker and self._worker.isRunning():
+        """Fetch weather data, answering from the cache while it's fresh."""
+        entry = self._cache.get(location)
+        if entry is not None and time.time() - entry[0] < self._ttl:
+            self._last_weather = entry[1]
+            self.weather_updated.emit(entry[1])
             return
         
-        self._worker = WeatherWorker(location)
-        self._worker.finished.connect(self._on_weather_fetched)
-        self._worker.start()
+        pending = self._pending.get(location)
+        if pending is not None and not pending.done():
+            return
+        
+        etag = last_modified = None
+        if entry is not None:
+            etag, last_modified = entry[2], entry[3]
+        
+        future = asyncio.run_coroutine_threadsafe(
+            self._worker.fetch(location, etag, last_modified), self._loop
+        )
+        future.add_done_callback(self._on_future_done)
+        self._pending[location] = future
     
-    def _on_weather_fetched(self, weather: Optional[WeatherData]):
-        if weather:
-            self._last_weather = weather
-            self.weather_updated.emit(weather)
+    def shutdown(self):
+        """Close the HTTP session and stop the event loop."""
+        if not self._loop.is_running():
+            return
+        asyncio.run_coroutine_threadsafe(
+            self._worker.close(), self._loop
+        ).result(timeout=REQUEST_TIMEOUT)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=REQUEST_TIMEOUT)
+    
+    def _on_future_done(self, future: Future):
+        # Runs on the loop thread; failed fetches leave the cache untouched
+        try:
+            result = future.result()
+        except Exception:
+            return
+        self._fetched.emit(result)
+    
+    def _on_weather_fetched(self, result: FetchResult):
+        weather = result.weather
+        if weather is None:
+            # 304 Not Modified: keep the cached data, just refresh its timestamp
+            entry = self._cache.get(result.location)
+            if entry is None:
+                return
+            weather = entry[1]
+        
+        self._cache[result.location] = (
+            time.time(), weather, result.etag, result.last_modified
+        )
+        self._save_cache()
+        
+        self._last_weather = weather
+        self.weather_updated.emit(weather)
+    
+    def _load_cache(self):
+        """Load cached weather from disk, ignoring a missing or corrupt file."""
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+            for location, entry in raw.items():
+                self._cache[location] = (
+                    float(entry['fetched_at']),
+                    WeatherData(**entry['weather']),
+                    entry.get('etag'),
+                    entry.get('last_modified')
+                )
+        except (OSError, ValueError, KeyError, TypeError):
+            self._cache.clear()
+            return
+        
+        # Seed last_weather so the UI has data before any fetch completes
+        if self._cache:
+            fetched_at, weather, _, _ = max(self._cache.values(), key=lambda e: e[0])
+            if time.time() - fetched_at < self._ttl:
+                self._last_weather = weather
+    
+    def _save_cache(self):
+        """Write the cache to disk so restarts can skip a cold fetch."""
+        raw = {
+            location: {
+                'fetched_at': fetched_at,
+                'weather': asdict(weather),
+                'etag': etag,
+                'last_modified': last_modified,
+            }
+            for location, (fetched_at, weather, etag, last_modified) in self._cache.items()
+        }
+        try:
+            os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+            # Write then swap, so a crash mid-write never leaves a truncated cache
+            tmp_path = self._cache_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(raw, f)
+            os.replace(tmp_path, self._cache_path)
+        except OSError as e:
+            print(f"Failed to save weather cache: {e}")
     
     @property
     def last_weather(self) -> Optional[WeatherData]:
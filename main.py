@@ -5,14 +5,15 @@ Dynamic island with weather, fullscreen mode, and smooth animations.
 
 import sys
 import os
+import functools
 from typing import Optional
 
 from PySide6.QtWidgets import (
     QApplication, QSystemTrayIcon, QMenu, QWidget
 )
 from PySide6.QtCore import (
-    Qt, QPropertyAnimation, QEasingCurve, QParallelAnimationGroup,
-    QRect, QPoint, QTimer, Signal, QObject
+    Qt, QPropertyAnimation, QEasingCurve,
+    QRect, QPoint, QTimer, Signal, QObject, QThreadPool
 )
 from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor, QAction
 
@@ -24,7 +25,7 @@ try:
 except ImportError:
     HAS_WIN32 = False
 
-from core.timer import PomodoroTimer, TimerState
+from core.timer import PomodoroTimer, TimerState, TickPayload, RUNNING_MASK, BREAK_MASK
 from core.database import Database, Task
 from core.sounds import SoundManager
 from core.weather import WeatherService
@@ -35,9 +36,60 @@ from ui.search_widget import SearchWidget
 from ui.styles import Theme, MIDNIGHT_STYLE
 
 
+_TRAY_MENU_QSS = """
+    QMenu {
+        background-color: #000000;
+        border: 1px solid #222222;
+        border-radius: 12px;
+        padding: 8px 4px;
+    }
+    QMenu::item {
+        background-color: transparent;
+        color: #FFFFFF;
+        padding: 10px 28px 10px 16px;
+        margin: 2px 4px;
+        border-radius: 6px;
+        font-size: 13px;
+        font-weight: 500;
+    }
+    QMenu::item:selected {
+        background-color: #4ADE80;
+        color: #000000;
+    }
+    QMenu::item:disabled {
+        color: #555555;
+    }
+    QMenu::separator {
+        height: 1px;
+        background: #222222;
+        margin: 6px 12px;
+    }
+"""
+
+
+def _clamp(lo: int, value: int, hi: int) -> int:
+    return max(lo, min(value, hi))
+
+
+@functools.cache
+def _tray_pixmap() -> QPixmap:
+    """Green circle tray icon, drawn once on first use (needs a QApplication)."""
+    pixmap = QPixmap(32, 32)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setBrush(QColor(Theme.ACCENT))  # Green #4ADE80
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawEllipse(2, 2, 28, 28)
+    painter.end()
+    return pixmap
+
+
 class AppController(QObject):
     """Main application controller with weather and fullscreen support."""
     
+    _stats_loaded = Signal(object)  # internal: (generation, stats tuple) from a pool thread
+    
     def __init__(self):
         super().__init__()
         
@@ -68,6 +120,23 @@ class AppController(QObject):
         self._is_fullscreen = False
         self._current_task: Optional[Task] = None
         self._current_session_id: Optional[int] = None
+        self._last_tick: Optional[TickPayload] = None
+        self._last_weather = None
+        self._tray_tip: Optional[tuple] = None  # (status, minutes left) shown in the tray tooltip
+        self._screen_geom: Optional[QRect] = None  # primary screen, dropped when it changes
+        
+        # Stats are read on the global thread pool; the generation number
+        # lets a newer refresh win over one that finishes late
+        self._stats_generation = 0
+        self._stats_loaded.connect(self._apply_stats)
+        
+        # Setting writes are applied in memory at once and saved together on
+        # the next event-loop pass, so one dashboard flush is one transaction
+        self._pending_settings: dict = {}
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(0)
+        self._settings_save_timer.timeout.connect(self._save_pending_settings)
         
         # New settings for desktop-only mode
         self._desktop_only_mode = False
@@ -83,23 +152,20 @@ class AppController(QObject):
         self._desktop_check_timer.timeout.connect(self._check_desktop_focus)
         self._desktop_check_timer.setInterval(500)
         
-        # Animation
-        self._anim_group: Optional[QParallelAnimationGroup] = None
+        # Expand/collapse fades - built once in initialize() alongside the
+        # single dashboard and island instances, then restarted on each use
+        self._expand_anim: Optional[QPropertyAnimation] = None
+        self._collapse_anim: Optional[QPropertyAnimation] = None
     
     def _load_settings(self):
-        settings = self.db.get_all_settings()
-        
-        work_duration = int(settings.get('work_duration', 25))
-        break_duration = int(settings.get('break_duration', 5))
-        alarm_sound = settings.get('alarm_sound', 'chime')
+        settings = self.db.get_settings()
         
-        # New settings
-        self._desktop_only_mode = settings.get('desktop_only_mode', 'false').lower() == 'true'
-        self._search_engine = settings.get('search_engine', 'Google')
+        self._desktop_only_mode = settings.desktop_only_mode
+        self._search_engine = settings.search_engine
         
-        self.timer.set_work_duration(work_duration)
-        self.timer.set_break_duration(break_duration)
-        self.sound_manager.set_sound(alarm_sound)
+        self.timer.set_work_duration(settings.work_duration)
+        self.timer.set_break_duration(settings.break_duration)
+        self.sound_manager.set_sound(settings.alarm_sound)
     
     def initialize(self):
         # Create mini island
@@ -124,6 +190,13 @@ class AppController(QObject):
         self.dashboard.daily_goal_changed.connect(self._on_daily_goal_changed)
         self.dashboard.hide()
         
+        self._expand_anim = self._make_fade_in(
+            self.dashboard, b"windowOpacity", Theme.EXPAND_DURATION
+        )
+        self._collapse_anim = self._make_fade_in(
+            self.island, b"opacity", Theme.COLLAPSE_DURATION
+        )
+        
         # Create fullscreen mode
         self.fullscreen = FullscreenMode()
         self.fullscreen.close_requested.connect(self._exit_fullscreen)
@@ -144,6 +217,11 @@ class AppController(QObject):
         # Connect weather
         self.weather_service.weather_updated.connect(self._on_weather_updated)
         
+        # Track the primary screen so expand/collapse can use a cached geometry
+        app = QApplication.instance()
+        app.primaryScreenChanged.connect(self._watch_screen)
+        self._watch_screen(app.primaryScreen())
+        
         # Setup system tray
         self._setup_tray()
         
@@ -152,13 +230,7 @@ class AppController(QObject):
         self._refresh_stats()
         
         # Load settings into dashboard
-        settings = self.db.get_all_settings()
-        settings.setdefault('work_duration', '25')
-        settings.setdefault('break_duration', '5')
-        settings.setdefault('alarm_sound', 'chime')
-        settings.setdefault('desktop_only_mode', 'false')
-        settings.setdefault('search_engine', 'Google')
-        self.dashboard.load_settings(settings)
+        self.dashboard.load_settings(self.db.get_settings())
         
         # Start desktop check if enabled
         if self._desktop_only_mode:
@@ -174,50 +246,12 @@ class AppController(QObject):
     def _setup_tray(self):
         self.tray_icon = QSystemTrayIcon()
         
-        # Create green circle icon
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QColor(Theme.ACCENT))  # Green #4ADE80
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(2, 2, 28, 28)
-        painter.end()
-        
-        self.tray_icon.setIcon(QIcon(pixmap))
+        self.tray_icon.setIcon(QIcon(_tray_pixmap()))
         self.tray_icon.setToolTip("Focus Timer")
         
         # Create menu with pure black box and green accent
         menu = QMenu()
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: #000000;
-                border: 1px solid #222222;
-                border-radius: 12px;
-                padding: 8px 4px;
-            }}
-            QMenu::item {{
-                background-color: transparent;
-                color: #FFFFFF;
-                padding: 10px 28px 10px 16px;
-                margin: 2px 4px;
-                border-radius: 6px;
-                font-size: 13px;
-                font-weight: 500;
-            }}
-            QMenu::item:selected {{
-                background-color: #4ADE80;
-                color: #000000;
-            }}
-            QMenu::item:disabled {{
-                color: #555555;
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background: #222222;
-                margin: 6px 12px;
-            }}
-        """)
+        menu.setStyleSheet(_TRAY_MENU_QSS)
         
         show_action = QAction("Show", menu)
         show_action.triggered.connect(self._show_app)
@@ -258,12 +292,24 @@ class AppController(QObject):
     def _on_weather_updated(self, weather):
         """Handle weather update."""
         if weather:
+            self._last_weather = weather
+            self._push_weather()
+    
+    def _push_weather(self):
+        """Show the latest weather on the fullscreen view or dashboard, if open.
+        
+        The island has no weather readout, so nothing is updated while collapsed.
+        """
+        weather = self._last_weather
+        if weather is None:
+            return
+        if self._is_fullscreen:
             self.fullscreen.set_weather(
                 weather.icon,
                 weather.display_temp,
                 weather.display_condition
             )
-            # Update dashboard too
+        elif self._is_expanded:
             self.dashboard.set_weather(
                 weather.icon,
                 weather.display_temp,
@@ -342,6 +388,8 @@ class AppController(QObject):
             return
         
         self._is_expanded = True
+        self._push_tick()
+        self._push_weather()
         
         # Get island position
         island_rect = self.island.geometry()
@@ -355,9 +403,9 @@ class AppController(QObject):
         dashboard_y = island_rect.top()
         
         # Keep on screen
-        screen = QApplication.primaryScreen().geometry()
-        dashboard_x = max(10, min(dashboard_x, screen.width() - dashboard_width - 10))
-        dashboard_y = max(10, min(dashboard_y, screen.height() - dashboard_height - 10))
+        screen = self._screen_geometry()
+        dashboard_x = _clamp(10, dashboard_x, screen.width() - dashboard_width - 10)
+        dashboard_y = _clamp(10, dashboard_y, screen.height() - dashboard_height - 10)
         
         # Fade out island
         self.island.set_opacity(0)
@@ -370,16 +418,8 @@ class AppController(QObject):
         self.dashboard.show()
         
         # Fade in animation
-        self._anim_group = QParallelAnimationGroup()
-        
-        opacity_anim = QPropertyAnimation(self.dashboard, b"windowOpacity")
-        opacity_anim.setDuration(Theme.EXPAND_DURATION)
-        opacity_anim.setStartValue(0.0)
-        opacity_anim.setEndValue(1.0)
-        opacity_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self._anim_group.addAnimation(opacity_anim)
-        
-        self._anim_group.start()
+        self._expand_anim.stop()
+        self._expand_anim.start()
     
     def _collapse_to_island(self):
         """Animate collapse from dashboard to mini island."""
@@ -387,6 +427,7 @@ class AppController(QObject):
             return
         
         self._is_expanded = False
+        self._push_tick()
         
         # Temporarily pause desktop check to prevent hiding the island right after it appears
         self._desktop_check_timer.stop()
@@ -403,8 +444,8 @@ class AppController(QObject):
         island_y = dashboard_rect.top()
         
         # Keep on screen
-        screen = QApplication.primaryScreen().geometry()
-        island_x = max(10, min(island_x, screen.width() - island_width - 10))
+        screen = self._screen_geometry()
+        island_x = _clamp(10, island_x, screen.width() - island_width - 10)
         island_y = max(10, island_y)
         
         # Hide dashboard
@@ -418,21 +459,36 @@ class AppController(QObject):
         self.island.raise_()
         
         # Fade in animation
-        self._anim_group = QParallelAnimationGroup()
-        
-        opacity_anim = QPropertyAnimation(self.island, b"opacity")
-        opacity_anim.setDuration(Theme.COLLAPSE_DURATION)
-        opacity_anim.setStartValue(0.0)
-        opacity_anim.setEndValue(1.0)
-        opacity_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self._anim_group.addAnimation(opacity_anim)
-        
-        self._anim_group.start()
+        self._collapse_anim.stop()
+        self._collapse_anim.start()
         
         # Resume desktop check after a delay (if enabled)
         if self._desktop_only_mode:
             QTimer.singleShot(1000, self._desktop_check_timer.start)
     
+    def _screen_geometry(self) -> QRect:
+        if self._screen_geom is None:
+            self._screen_geom = QApplication.primaryScreen().geometry()
+        return self._screen_geom
+    
+    def _watch_screen(self, screen):
+        """Drop the cached geometry now and whenever this screen is resized."""
+        self._screen_geom = None
+        if screen is not None:
+            screen.geometryChanged.connect(self._forget_screen_geometry)
+    
+    def _forget_screen_geometry(self, *args):
+        self._screen_geom = None
+    
+    def _make_fade_in(self, target: QObject, prop: bytes, duration: int) -> QPropertyAnimation:
+        """Create a reusable 0 -> 1 fade for a widget property."""
+        anim = QPropertyAnimation(target, prop, self)
+        anim.setDuration(duration)
+        anim.setStartValue(0.0)
+        anim.setEndValue(1.0)
+        anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+        return anim
+    
     def _enter_fullscreen(self):
         """Enter fullscreen focus mode."""
         self._is_fullscreen = True
@@ -442,13 +498,16 @@ class AppController(QObject):
         
         # Update fullscreen with current timer state
         self.fullscreen.update_timer(self.timer.remaining_formatted, self.timer.progress)
-        self.fullscreen.set_running(self.timer.state in (TimerState.RUNNING, TimerState.BREAK))
+        self.fullscreen.set_running(self.timer.is_running)
         self.fullscreen.set_break_mode(self.timer.is_break)
+        self._push_weather()
     
     def _exit_fullscreen(self):
         """Exit fullscreen mode."""
         self._is_fullscreen = False
         self.fullscreen.hide()
+        self._push_tick()
+        self._push_weather()
         
         # Temporarily pause desktop check
         if self._desktop_only_mode:
@@ -491,17 +550,32 @@ class AppController(QObject):
         else:
             self.timer.skip_to_break()
     
-    def _on_timer_tick(self, remaining: int):
-        time_text = self.timer.remaining_formatted
-        progress = self.timer.progress
+    def _on_timer_tick(self, payload: TickPayload):
+        self._last_tick = payload
+        self._push_tick()
+        self._update_tray_tooltip(payload.state, payload.remaining)
+    
+    def _push_tick(self):
+        """Send the latest tick to whichever view is on screen.
         
-        self.island.update_timer(time_text, progress)
-        self.dashboard.update_timer(time_text, progress, remaining)
-        self.fullscreen.update_timer(time_text, progress)
+        Hidden views are brought up to date when they are shown again.
+        """
+        payload = self._last_tick
+        if payload is None:
+            return
+        time_text = payload.mmss
+        progress = payload.permille / 1000
+        
+        if self._is_fullscreen:
+            self.fullscreen.update_timer(time_text, progress)
+        elif self._is_expanded:
+            self.dashboard.update_timer(time_text, progress, payload.remaining)
+        else:
+            self.island.update_timer(time_text, progress)
     
     def _on_timer_state_changed(self, state: TimerState):
-        is_running = state in (TimerState.RUNNING, TimerState.BREAK)
-        is_break = state in (TimerState.BREAK, TimerState.BREAK_PAUSED)
+        is_running = bool(state & RUNNING_MASK)
+        is_break = bool(state & BREAK_MASK)
         
         self.island.set_running(is_running)
         self.island.set_break_mode(is_break)
@@ -512,21 +586,41 @@ class AppController(QObject):
         self.fullscreen.set_running(is_running)
         self.fullscreen.set_break_mode(is_break)
         
-        if is_running:
-            status = "Break" if is_break else "Working"
-            self.tray_icon.setToolTip(f"Focus Timer - {status}: {self.timer.remaining_formatted}")
+        self._update_tray_tooltip(state, self.timer.remaining_seconds)
+    
+    def _update_tray_tooltip(self, state: TimerState, remaining: int):
+        """Keep the tray tooltip current to the minute, setting it only when it changes."""
+        if state & RUNNING_MASK:
+            status = "Break" if state & BREAK_MASK else "Working"
+            tip = (status, -(-remaining // 60))
         else:
+            tip = ("Paused", None)
+        if tip == self._tray_tip:
+            return
+        self._tray_tip = tip
+        
+        status, minutes = tip
+        if minutes is None:
             self.tray_icon.setToolTip("Focus Timer - Paused")
+        else:
+            self.tray_icon.setToolTip(f"Focus Timer - {status}: {minutes} min left")
     
     def _on_work_finished(self):
-        if self._current_session_id:
-            elapsed = self.timer.config.work_duration
-            self.db.end_session(self._current_session_id, elapsed, completed=True)
-            self._current_session_id = None
+        # Close the work session and open the break in a single commit
+        with self.db.transaction():
+            if self._current_session_id:
+                elapsed = self.timer.config.work_duration
+                self.db.end_session(self._current_session_id, elapsed, completed=True)
+                self._current_session_id = None
+                
+                # Update daily goal progress
+                elapsed_minutes = elapsed // 60
+                self.db.add_to_daily_goal(elapsed_minutes)
             
-            # Update daily goal progress
-            elapsed_minutes = elapsed // 60
-            self.db.add_to_daily_goal(elapsed_minutes)
+            self._current_session_id = self.db.start_session(
+                self._current_task.id if self._current_task else None,
+                "break"
+            )
         
         self.sound_manager.play_alarm()
         
@@ -537,11 +631,6 @@ class AppController(QObject):
             3000
         )
         
-        self._current_session_id = self.db.start_session(
-            self._current_task.id if self._current_task else None,
-            "break"
-        )
-        
         self._refresh_stats()
     
     def _on_break_finished(self):
@@ -596,14 +685,28 @@ class AppController(QObject):
         self.dashboard.update_tasks_list(tasks)
     
     def _refresh_stats(self):
-        today = self.db.get_today_stats()
-        weekly = self.db.get_daily_stats(7)
-        total = self.db.get_total_stats()
+        """Reload stats and the daily goal without blocking the GUI thread."""
+        self._stats_generation += 1
+        generation = self._stats_generation
+        QThreadPool.globalInstance().start(lambda: self._load_stats(generation))
+    
+    def _load_stats(self, generation: int):
+        # Runs on a pool thread; Database reads use its reader connection pool
+        stats = (
+            self.db.get_today_stats(),
+            self.db.get_daily_stats(7),
+            self.db.get_total_stats(),
+            self.db.get_daily_goal(),
+            self.db.get_streak(),
+        )
+        # Queued across threads, so _apply_stats runs on the Qt thread
+        self._stats_loaded.emit((generation, stats))
+    
+    def _apply_stats(self, result):
+        generation, (today, weekly, total, goal, streak) = result
+        if generation != self._stats_generation:
+            return
         self.dashboard.update_stats(today, weekly, total)
-        
-        # Update daily goal
-        goal = self.db.get_daily_goal()
-        streak = self.db.get_streak()
         self.dashboard.update_daily_goal(goal, streak)
     
     # ============== Settings ==============
@@ -620,7 +723,8 @@ class AppController(QObject):
         self._refresh_stats()
     
     def _on_setting_changed(self, key: str, value: str):
-        self.db.set_setting(key, value)
+        self._pending_settings[key] = value
+        self._settings_save_timer.start()
         
         if key == "work_duration":
             self.timer.set_work_duration(int(value))
@@ -644,6 +748,11 @@ class AppController(QObject):
             if self.search_widget:
                 self.search_widget.set_search_engine(value)
     
+    def _save_pending_settings(self):
+        self._settings_save_timer.stop()
+        pending, self._pending_settings = self._pending_settings, {}
+        self.db.set_settings(pending)
+    
     # ============== Tray Actions ==============
     
     def _on_tray_activated(self, reason):
@@ -676,12 +785,21 @@ class AppController(QObject):
         self._desktop_check_timer.stop()
         self._weather_timer.stop()
         
+        self.dashboard.flush_settings()
+        self._save_pending_settings()
+        self.weather_service.shutdown()
+        # Let any in-flight stats read finish before its connections close
+        QThreadPool.globalInstance().waitForDone()
+        self.db.close()
+        
         self.tray_icon.hide()
         QApplication.quit()
     
     # ============== Helpers ==============
     
     def _update_ui(self):
+        # Every view gets the live state here, so there is no tick left to replay
+        self._last_tick = None
         time_text = self.timer.remaining_formatted
         progress = self.timer.progress
         remaining = self.timer.remaining_seconds
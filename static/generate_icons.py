@@ -54,16 +54,20 @@ def save_icons(output_dir: str):
     """Save icons in various sizes."""
     os.makedirs(output_dir, exist_ok=True)
     
-    # Create icons at different sizes
+    # Draw once at full size and scale down for the smaller icons
+    master = create_icon(256)
     sizes = [16, 32, 48, 64, 128, 256]
     
     for size in sizes:
-        pixmap = create_icon(size)
+        if size == master.width():
+            pixmap = master
+        else:
+            pixmap = master.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                                   Qt.TransformationMode.SmoothTransformation)
         pixmap.save(os.path.join(output_dir, f'icon_{size}.png'))
     
     # Save main icon
-    main_icon = create_icon(256)
-    main_icon.save(os.path.join(output_dir, 'icon.png'))
+    master.save(os.path.join(output_dir, 'icon.png'))
     
     print(f"Created icons in {output_dir}")
 
@@ -4,35 +4,59 @@ These are basic sine wave tones as placeholders.
 """
 
 import wave
-import struct
+import array
 import math
 import os
+import sys
+
+# NumPy renders each tone segment in a few vector ops; without it we fall
+# back to a plain loop that still avoids per-sample struct packing
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _segment_numpy(freq: float, num_samples: int, sample_rate: int,
+                   amplitude: float) -> bytes:
+    i = np.arange(num_samples, dtype=np.float64)
+    t = i / sample_rate
+    envelope = np.minimum(1.0, np.minimum(i / 500, (num_samples - i) / 500))  # Fade in/out
+    values = amplitude * envelope * np.sin(2 * math.pi * freq * t)
+    # astype truncates toward zero, like int()
+    return (values * 32767).astype('<i2').tobytes()
+
+
+def _segment_python(freq: float, num_samples: int, sample_rate: int,
+                    amplitude: float) -> bytes:
+    sin = math.sin
+    two_pi_f = 2 * math.pi * freq
+    samples = array.array('h', (
+        int(amplitude * min(1.0, min(i / 500, (num_samples - i) / 500))
+            * sin(two_pi_f * (i / sample_rate)) * 32767)
+        for i in range(num_samples)
+    ))
+    if sys.byteorder == 'big':
+        samples.byteswap()  # WAV data is little-endian
+    return samples.tobytes()
 
 
 def generate_tone(filename: str, frequencies: list, durations: list, 
                   sample_rate: int = 44100, amplitude: float = 0.5):
     """Generate a WAV file with multiple tones."""
-    frames = []
-    
-    for freq, duration in zip(frequencies, durations):
-        num_samples = int(sample_rate * duration)
-        
-        for i in range(num_samples):
-            # Sine wave with envelope
-            t = i / sample_rate
-            envelope = min(1.0, min(i / 500, (num_samples - i) / 500))  # Fade in/out
-            value = amplitude * envelope * math.sin(2 * math.pi * freq * t)
-            
-            # Convert to 16-bit integer
-            packed = struct.pack('h', int(value * 32767))
-            frames.append(packed)
+    render = _segment_numpy if NUMPY_AVAILABLE else _segment_python
+    segments = [
+        render(freq, int(sample_rate * duration), sample_rate, amplitude)
+        for freq, duration in zip(frequencies, durations)
+    ]
     
     # Write WAV file
     with wave.open(filename, 'wb') as wav_file:
         wav_file.setnchannels(1)
         wav_file.setsampwidth(2)
         wav_file.setframerate(sample_rate)
-        wav_file.writeframes(b''.join(frames))
+        wav_file.writeframes(b''.join(segments))
 
 
 def create_sounds(output_dir: str):
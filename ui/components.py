@@ -5,25 +5,92 @@ Pure black with green accent - Dynamic Island style.
 
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel, 
-    QPushButton, QCheckBox, QLineEdit, QFrame,
-    QGraphicsDropShadowEffect, QSizePolicy
+    QPushButton, QLineEdit, QFrame,
+    QSizePolicy, QStyledItemDelegate, QStyle
 )
-from PySide6.QtCore import Qt, Signal, QSize, QPropertyAnimation, QEasingCurve, Property, QRect
-from PySide6.QtGui import QColor, QPainter, QPainterPath, QBrush, QPen, QFont, QPixmap
-from typing import Optional
+from PySide6.QtCore import (
+    Qt, Signal, QSize, QPropertyAnimation, QEasingCurve, Property, QRect,
+    QAbstractListModel, QModelIndex, QEvent
+)
+from PySide6.QtGui import (
+    QColor, QPainter, QPainterPath, QBrush, QPen, QFont, QPixmap,
+    QPixmapCache, QFontMetrics
+)
+from typing import Optional, Dict, Tuple, List
 from ui.icons import IconPainter
 from ui.styles import Theme
 
 
+_ICON_PAINTERS = {
+    'play': IconPainter.draw_play,
+    'pause': IconPainter.draw_pause,
+    'reset': IconPainter.draw_reset,
+    'skip': IconPainter.draw_skip,
+    'check': IconPainter.draw_check,
+    'plus': IconPainter.draw_plus,
+    'trash': IconPainter.draw_trash,
+    'collapse': IconPainter.draw_collapse,
+    'settings': IconPainter.draw_settings,
+    'expand': IconPainter.draw_expand,
+    'close': IconPainter.draw_close,
+    'search': IconPainter.draw_search,
+}
+
+# Rendered icon pixmaps shared by every IconButton, keyed by
+# (icon type, button size, icon size, color, device pixel ratio)
+_ICON_CACHE: Dict[Tuple[str, int, int, str, float], QPixmap] = {}
+
+
+def _icon_pixmap(icon_type: str, size: int, icon_size: int, color: str, ratio: float) -> QPixmap:
+    """Return a cached pixmap of an icon centered in a size x size button."""
+    key = (icon_type, size, icon_size, color, ratio)
+    pixmap = _ICON_CACHE.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(int(size * ratio), int(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        draw = _ICON_PAINTERS.get(icon_type)
+        if draw is not None:
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            offset = (size - icon_size) // 2
+            draw(painter, QRect(offset, offset, icon_size, icon_size), QColor(color))
+            painter.end()
+        
+        _ICON_CACHE[key] = pixmap
+    return pixmap
+
+
+# Smallest progress change worth repainting a ring for: one degree of arc
+PROGRESS_STEP = 1 / 360
+
+
+def progress_moved(old: float, new: float) -> bool:
+    """True if a ring drawn at `old` should be redrawn for `new`.
+    
+    Sub-degree moves are skipped, except when landing exactly on empty or full.
+    """
+    if new == old:
+        return False
+    return abs(new - old) >= PROGRESS_STEP or new in (0.0, 1.0)
+
+
 class CircularProgress(QWidget):
-    """Circular progress indicator for timer display."""
+    """Circular progress indicator for timer display.
     
-    def __init__(self, size: int = 180, parent: Optional[QWidget] = None):
+    With cached=True the static background track is rendered once into a
+    pixmap, so each repaint only draws the progress arc.
+    """
+    
+    def __init__(self, size: int = 180, parent: Optional[QWidget] = None, cached: bool = False):
         super().__init__(parent)
         self._progress = 0.0
         self._size = size
         self._line_width = 5
         self._is_break = False
+        self._cached = cached
+        self._track_pm: Optional[QPixmap] = None
         
         self.setFixedSize(size, size)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
@@ -41,17 +108,42 @@ class CircularProgress(QWidget):
         self._is_break = is_break
         self.update()
     
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
+    def _arc_rect(self) -> QRect:
         margin = self._line_width + 2
-        rect = self.rect().adjusted(margin, margin, -margin, -margin)
-        
+        return self.rect().adjusted(margin, margin, -margin, -margin)
+    
+    def _draw_track(self, painter: QPainter):
         # Background track - very subtle
         bg_color = QColor(255, 255, 255, 10)
         painter.setPen(QPen(bg_color, self._line_width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
-        painter.drawEllipse(rect)
+        painter.drawEllipse(self._arc_rect())
+    
+    def _render_track(self):
+        ratio = self.devicePixelRatioF()
+        self._track_pm = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        self._track_pm.setDevicePixelRatio(ratio)
+        self._track_pm.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(self._track_pm)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._draw_track(painter)
+        painter.end()
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._cached:
+            self._render_track()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        
+        if self._cached:
+            if self._track_pm is None:
+                self._render_track()
+            painter.drawPixmap(0, 0, self._track_pm)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        else:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self._draw_track(painter)
         
         # Progress arc - green or yellow
         if self._progress > 0:
@@ -64,11 +156,75 @@ class CircularProgress(QWidget):
             
             start_angle = 90 * 16
             span_angle = -int(self._progress * 360 * 16)
-            painter.drawArc(rect, start_angle, span_angle)
+            painter.drawArc(self._arc_rect(), start_angle, span_angle)
         
         painter.end()
 
 
+class TimerDisplay(QLabel):
+    """Large "MM:SS" readout that shows cached pixmaps instead of shaping text.
+    
+    Each distinct string is rendered once per color and kept in QPixmapCache,
+    so a running timer mostly just swaps pixmaps.
+    """
+    
+    def __init__(self, text: str = "", pixel_size: int = 42, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._text = ""
+        self._is_break = False
+        
+        self._font = QFont("Segoe UI")
+        self._font.setPixelSize(pixel_size)
+        self._font.setWeight(QFont.Weight.ExtraBold)
+        self._font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, 2)
+        self._metrics = QFontMetrics(self._font)
+        self._key_prefix = f"timer:{pixel_size}"
+        
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.set_time(text)
+    
+    def text(self) -> str:
+        return self._text
+    
+    def set_time(self, text: str):
+        if text == self._text:
+            return
+        self._text = text
+        self._refresh()
+    
+    def set_break_mode(self, is_break: bool):
+        if is_break == self._is_break:
+            return
+        self._is_break = is_break
+        self._refresh()
+    
+    def _refresh(self):
+        color = Theme.BREAK_COLOR if self._is_break else Theme.TEXT_PRIMARY
+        ratio = self.devicePixelRatioF()
+        key = f"{self._key_prefix}:{color}:{ratio}:{self._text}"
+        
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = self._render(self._text, color, ratio)
+            QPixmapCache.insert(key, pixmap)
+        self.setPixmap(pixmap)
+    
+    def _render(self, text: str, color: str, ratio: float) -> QPixmap:
+        width = max(self._metrics.horizontalAdvance(text), 1)
+        height = self._metrics.height()
+        
+        pixmap = QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.setFont(self._font)
+        painter.setPen(QColor(color))
+        painter.drawText(QRect(0, 0, width, height), Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
+        return pixmap
+
+
 class MiniCircularProgress(QWidget):
     """Small circular progress for mini island view."""
     
@@ -154,42 +310,12 @@ class IconButton(QPushButton):
     def paintEvent(self, event):
         super().paintEvent(event)
         
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Center the icon
-        x = (self._size - self._icon_size) // 2
-        y = (self._size - self._icon_size) // 2
-        rect = QRect(x, y, self._icon_size, self._icon_size)
-        
-        color = QColor(Theme.ACCENT_LIGHT if self.underMouse() else Theme.TEXT_PRIMARY)
-        
-        # Draw appropriate icon
-        if self._icon_type == 'play':
-            IconPainter.draw_play(painter, rect, color)
-        elif self._icon_type == 'pause':
-            IconPainter.draw_pause(painter, rect, color)
-        elif self._icon_type == 'reset':
-            IconPainter.draw_reset(painter, rect, color)
-        elif self._icon_type == 'skip':
-            IconPainter.draw_skip(painter, rect, color)
-        elif self._icon_type == 'check':
-            IconPainter.draw_check(painter, rect, color)
-        elif self._icon_type == 'plus':
-            IconPainter.draw_plus(painter, rect, color)
-        elif self._icon_type == 'trash':
-            IconPainter.draw_trash(painter, rect, color)
-        elif self._icon_type == 'collapse':
-            IconPainter.draw_collapse(painter, rect, color)
-        elif self._icon_type == 'settings':
-            IconPainter.draw_settings(painter, rect, color)
-        elif self._icon_type == 'expand':
-            IconPainter.draw_expand(painter, rect, color)
-        elif self._icon_type == 'close':
-            IconPainter.draw_close(painter, rect, color)
-        elif self._icon_type == 'search':
-            IconPainter.draw_search(painter, rect, color)
+        color = Theme.ACCENT_LIGHT if self.underMouse() else Theme.TEXT_PRIMARY
+        pixmap = _icon_pixmap(self._icon_type, self._size, self._icon_size, color,
+                              self.devicePixelRatioF())
         
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
         painter.end()
 
 
@@ -242,103 +368,191 @@ class ControlButton(QPushButton):
         painter.end()
 
 
-class TaskItemWidget(QWidget):
-    """Individual task item with checkbox and delete button."""
+class TaskListModel(QAbstractListModel):
+    """List model over Task rows for a QListView."""
+    
+    TaskIdRole = Qt.ItemDataRole.UserRole + 1
+    CompletedRole = Qt.ItemDataRole.UserRole + 2
+    FocusSecondsRole = Qt.ItemDataRole.UserRole + 3
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks: List = []
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tasks)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        task = self._tasks[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return task.name
+        if role == self.TaskIdRole:
+            return task.id
+        if role == self.CompletedRole:
+            return task.completed
+        if role == self.FocusSecondsRole:
+            return task.total_focus_seconds
+        return None
+    
+    def set_tasks(self, tasks: List):
+        """Apply a new task list as row removals, inserts and per-row changes.
+        
+        Falls back to a full reset only when surviving tasks were reordered.
+        """
+        new_ids = {t.id for t in tasks}
+        
+        # Drop stale rows from the bottom up, one contiguous run at a time
+        row = len(self._tasks) - 1
+        while row >= 0:
+            if self._tasks[row].id in new_ids:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self._tasks[row].id not in new_ids:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self._tasks[row + 1:last + 1]
+            self.endRemoveRows()
+        
+        old_ids = {t.id for t in self._tasks}
+        if [t.id for t in tasks if t.id in old_ids] != [t.id for t in self._tasks]:
+            self.beginResetModel()
+            self._tasks = list(tasks)
+            self.endResetModel()
+            return
+        
+        for row, task in enumerate(tasks):
+            if row < len(self._tasks) and self._tasks[row].id == task.id:
+                if self._tasks[row] != task:
+                    self._tasks[row] = task
+                    index = self.index(row)
+                    self.dataChanged.emit(index, index)
+            else:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._tasks.insert(row, task)
+                self.endInsertRows()
+
+
+class TaskItemDelegate(QStyledItemDelegate):
+    """Paints a task row (checkbox, name, focus time, delete button) directly.
+    
+    No widget is created per task, so only visible rows cost anything.
+    """
     
     toggled = Signal(int, bool)
     deleted = Signal(int)
     selected = Signal(int)
     
-    def __init__(self, task_id: int, name: str, completed: bool = False, 
-                 focus_time: int = 0, parent: Optional[QWidget] = None):
+    ROW_HEIGHT = 48
+    ROW_SPACING = 6
+    CHECKBOX_SIZE = 18
+    DELETE_SIZE = 28
+    
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.task_id = task_id
-        self._completed = completed
-        
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.setFixedHeight(48)
-        self._apply_style()
+        self._name_font = QFont()
+        self._name_font.setPixelSize(12)
+        self._name_font.setWeight(QFont.Weight.Medium)
+        self._done_font = QFont(self._name_font)
+        self._done_font.setStrikeOut(True)
+        self._time_font = QFont()
+        self._time_font.setPixelSize(10)
+    
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), self.ROW_HEIGHT + self.ROW_SPACING)
+    
+    def _row_rect(self, option) -> QRect:
+        rect = option.rect
+        return QRect(rect.x(), rect.y(), rect.width(), self.ROW_HEIGHT)
+    
+    def _checkbox_rect(self, row: QRect) -> QRect:
+        top = row.y() + (row.height() - self.CHECKBOX_SIZE) // 2
+        return QRect(row.x() + 12, top, self.CHECKBOX_SIZE, self.CHECKBOX_SIZE)
+    
+    def _delete_rect(self, row: QRect) -> QRect:
+        top = row.y() + (row.height() - self.DELETE_SIZE) // 2
+        return QRect(row.right() - 8 - self.DELETE_SIZE + 1, top, self.DELETE_SIZE, self.DELETE_SIZE)
+    
+    @staticmethod
+    def _format_time(seconds: int) -> str:
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        return f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
+    
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        completed = bool(index.data(TaskListModel.CompletedRole))
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        row = self._row_rect(option)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
         
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(12, 8, 8, 8)
-        layout.setSpacing(10)
+        # Card background
+        painter.setBrush(QColor(Theme.BG_HOVER if hovered else Theme.BG_ELEVATED))
+        painter.drawRoundedRect(row, 10, 10)
         
         # Checkbox
-        self.checkbox = QCheckBox()
-        self.checkbox.setChecked(completed)
-        self.checkbox.toggled.connect(self._on_toggle)
-        self.checkbox.setStyleSheet(f"""
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                border: 1px solid {Theme.BORDER_LIGHT};
-                background: {Theme.BG_DARK};
-            }}
-            QCheckBox::indicator:checked {{
-                background: {Theme.ACCENT};
-                border-color: {Theme.ACCENT};
-            }}
-        """)
-        layout.addWidget(self.checkbox)
-        
-        # Task info
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(1)
-        
-        self.name_label = QLabel(name)
-        self.name_label.setStyleSheet(f"""
-            color: {Theme.TEXT_MUTED if completed else Theme.TEXT_PRIMARY};
-            font-size: 12px;
-            font-weight: 500;
-            text-decoration: {"line-through" if completed else "none"};
-        """)
-        info_layout.addWidget(self.name_label)
-        
-        # Focus time
-        hours = focus_time // 3600
-        minutes = (focus_time % 3600) // 60
-        time_str = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
-        self.time_label = QLabel(time_str if focus_time > 0 else "0m")
-        self.time_label.setStyleSheet(f"color: {Theme.TEXT_MUTED}; font-size: 10px;")
-        info_layout.addWidget(self.time_label)
-        
-        layout.addLayout(info_layout, 1)
-        
-        # Delete button
-        self.delete_btn = IconButton("trash", 28)
-        self.delete_btn.clicked.connect(lambda: self.deleted.emit(self.task_id))
-        self.delete_btn.setToolTip("Delete")
-        layout.addWidget(self.delete_btn)
-    
-    def _apply_style(self):
-        self.setStyleSheet(f"""
-            QWidget {{
-                background: {Theme.BG_ELEVATED};
-                border-radius: 10px;
-            }}
-            QWidget:hover {{
-                background: {Theme.BG_HOVER};
-            }}
-        """)
-    
-    def _on_toggle(self, checked: bool):
-        self._completed = checked
-        self.name_label.setStyleSheet(f"""
-            color: {Theme.TEXT_MUTED if checked else Theme.TEXT_PRIMARY};
-            font-size: 12px;
-            font-weight: 500;
-            text-decoration: {"line-through" if checked else "none"};
-        """)
-        self._apply_style()
-        self.toggled.emit(self.task_id, checked)
-    
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            if not self.checkbox.geometry().contains(event.pos()) and \
-               not self.delete_btn.geometry().contains(event.pos()):
-                self.selected.emit(self.task_id)
-        super().mousePressEvent(event)
+        box = self._checkbox_rect(row)
+        if completed:
+            painter.setBrush(QColor(Theme.ACCENT))
+            painter.setPen(QPen(QColor(Theme.ACCENT), 1))
+        else:
+            painter.setBrush(QColor(Theme.BG_DARK))
+            painter.setPen(QPen(QColor(Theme.BORDER_LIGHT), 1))
+        painter.drawRoundedRect(box, 4, 4)
+        
+        # Name and focus time
+        text_left = box.right() + 11
+        text_width = self._delete_rect(row).left() - 10 - text_left
+        mid = row.y() + row.height() // 2
+        
+        painter.setFont(self._done_font if completed else self._name_font)
+        painter.setPen(QColor(Theme.TEXT_MUTED if completed else Theme.TEXT_PRIMARY))
+        name = painter.fontMetrics().elidedText(
+            index.data(Qt.ItemDataRole.DisplayRole), Qt.TextElideMode.ElideRight, text_width
+        )
+        painter.drawText(QRect(text_left, row.y() + 8, text_width, mid - row.y() - 8),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom, name)
+        
+        painter.setFont(self._time_font)
+        painter.setPen(QColor(Theme.TEXT_MUTED))
+        painter.drawText(QRect(text_left, mid + 1, text_width, row.bottom() - 8 - mid),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+                         self._format_time(index.data(TaskListModel.FocusSecondsRole) or 0))
+        
+        # Delete button, drawn from the shared icon cache
+        delete = self._delete_rect(row)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(Theme.BG_ELEVATED))
+        painter.drawEllipse(delete)
+        painter.drawPixmap(delete.topLeft(), _icon_pixmap(
+            'trash', self.DELETE_SIZE, self.DELETE_SIZE // 2, Theme.TEXT_PRIMARY,
+            painter.device().devicePixelRatioF()
+        ))
+        
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() != QEvent.Type.MouseButtonRelease or \
+           event.button() != Qt.MouseButton.LeftButton:
+            return False
+        
+        row = self._row_rect(option)
+        pos = event.position().toPoint()
+        if not row.contains(pos):
+            return False
+        
+        task_id = index.data(TaskListModel.TaskIdRole)
+        if self._checkbox_rect(row).adjusted(-4, -4, 4, 4).contains(pos):
+            self.toggled.emit(task_id, not index.data(TaskListModel.CompletedRole))
+        elif self._delete_rect(row).contains(pos):
+            self.deleted.emit(task_id)
+        else:
+            self.selected.emit(task_id)
+        return True
 
 
 class StatsBarWidget(QWidget):
@@ -407,10 +621,84 @@ class StatsBarWidget(QWidget):
         self._update_fill()
     
     def set_value(self, value: float, max_value: float):
+        if value == self._value and max_value == self._max_value:
+            return
         self._value = value
         self._max_value = max_value
         self.value_label.setText(self._format_value(value))
         self._update_fill()
+    
+    def set_values(self, label: str, value: float, max_value: float):
+        """Relabel and refill the bar, touching only what changed."""
+        if label != self.label.text():
+            self.label.setText(label)
+        self.set_value(value, max_value)
+
+
+class GoalProgressBar(QWidget):
+    """Thin rounded progress bar painted from cached pixmaps."""
+    
+    def __init__(self, height: int = 6, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._progress = 0.0
+        self._achieved = False
+        self._bg: Optional[QPixmap] = None
+        self._fills = {}
+        self._ratio = 0.0
+        
+        self.setFixedHeight(height)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+    
+    def set_progress(self, value: float, achieved: bool = False):
+        value = max(0.0, min(1.0, value))
+        if value == self._progress and achieved == self._achieved:
+            return
+        self._progress = value
+        self._achieved = achieved
+        self.update()
+    
+    def _render(self, color: str, ratio: float) -> QPixmap:
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(color))
+        radius = self.height() / 2
+        painter.drawRoundedRect(self.rect(), radius, radius)
+        painter.end()
+        return pixmap
+    
+    def _render_all(self):
+        # Track and both fill colors are rendered once per size and pixel ratio
+        ratio = self.devicePixelRatioF()
+        self._ratio = ratio
+        self._bg = self._render(Theme.BG_HOVER, ratio)
+        self._fills = {
+            True: self._render(Theme.ACCENT, ratio),
+            False: self._render(Theme.SECONDARY, ratio),
+        }
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._render_all()
+    
+    def paintEvent(self, event):
+        if self._bg is None or self._ratio != self.devicePixelRatioF():
+            # Moved to a screen with a different scale factor
+            self._render_all()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg)
+        
+        fill_width = int(self.width() * self._progress)
+        if fill_width > 0:
+            target = QRect(0, 0, fill_width, self.height())
+            # Source rect is in device pixels of the high-DPI pixmap
+            source = QRect(0, 0, int(fill_width * self._ratio), int(self.height() * self._ratio))
+            painter.drawPixmap(target, self._fills[self._achieved], source)
+        
+        painter.end()
 
 
 class GlassCard(QFrame):
@@ -5,30 +5,234 @@ Pure black with green accent - Dynamic Island style.
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QLineEdit, QScrollArea, QFrame, QStackedWidget, QComboBox,
-    QSlider, QGraphicsDropShadowEffect, QApplication, QSpacerItem,
-    QSizePolicy, QTabWidget, QSpinBox
+    QLineEdit, QFrame, QStackedWidget, QComboBox,
+    QSlider, QApplication, QSpacerItem,
+    QSizePolicy, QTabWidget, QSpinBox, QButtonGroup, QGridLayout, QListView
 )
 from PySide6.QtCore import (
     Qt, Signal, QPoint, QPropertyAnimation, QEasingCurve,
-    Property, QRect, QTimer, QParallelAnimationGroup
+    Property, QRect, QTimer, QParallelAnimationGroup, QSignalBlocker
 )
 from PySide6.QtGui import (
-    QColor, QPainter, QPainterPath, QBrush, QPen,
-    QLinearGradient, QFont, QKeySequence, QShortcut
+    QColor, QPainter, QBrush, QPen,
+    QLinearGradient, QFont, QKeySequence, QShortcut, QFontMetrics,
+    QPixmap, QPixmapCache
 )
 from typing import Optional, List
-from datetime import datetime, timedelta
+from functools import partial
+from contextlib import ExitStack
+from dataclasses import replace
+import time
 
 from ui.components import (
-    CircularProgress, IconButton, ControlButton, TaskItemWidget, 
-    StatsBarWidget, GlassCard, AnimatedButton
+    CircularProgress, IconButton, ControlButton, TaskListModel, TaskItemDelegate,
+    StatsBarWidget, GlassCard, AnimatedButton, GoalProgressBar, TimerDisplay,
+    progress_moved
 )
 from ui.styles import Theme
-from core.database import Task, DailyStats, DailyGoal
+from core.database import Task, DailyStats, DailyGoal, Settings
 from core.quotes import get_random_quote, get_break_quote
 
 
+# Tab bar rules, interpolated from Theme once at import. Theme is a
+# constant class, so there is nothing to rebuild at runtime.
+_TAB_QSS = f"""
+    QTabWidget#dashboardTabs::pane {{
+        border: none;
+        background: transparent;
+    }}
+    QTabWidget#dashboardTabs QTabBar::tab {{
+        background: transparent;
+        color: {Theme.TEXT_MUTED};
+        border: none;
+        padding: 8px 16px;
+        margin-right: 4px;
+        border-radius: 8px;
+        font-size: 11px;
+        font-weight: 600;
+    }}
+    QTabWidget#dashboardTabs QTabBar::tab:selected {{
+        background: {Theme.ACCENT};
+        color: {Theme.BG_DARKEST};
+    }}
+    QTabWidget#dashboardTabs QTabBar::tab:hover:!selected {{
+        background: rgba(255,255,255,0.05);
+        color: {Theme.TEXT_SECONDARY};
+    }}
+"""
+
+# One stylesheet for the whole dashboard, matched by object name, so Qt
+# polishes the widget tree against a single sheet instead of one per widget.
+_DASHBOARD_QSS = _TAB_QSS + f"""
+    QWidget#card {{
+        background: {Theme.BG_ELEVATED};
+        border-radius: 14px;
+    }}
+    QWidget#pill {{
+        background: {Theme.BG_ELEVATED};
+        border-radius: 12px;
+    }}
+    
+    QLabel#title {{ font-size: 14px; font-weight: 700; color: {Theme.TEXT_PRIMARY}; }}
+    QLabel#weather {{ font-size: 10px; color: {Theme.TEXT_MUTED}; margin-left: 8px; }}
+    QLabel#status {{ font-size: 11px; color: {Theme.TEXT_MUTED}; font-weight: 500; }}
+    QLabel#taskLabel {{ font-size: 11px; color: {Theme.TEXT_SECONDARY}; font-weight: 500; }}
+    QLabel#sectionTitle {{ font-size: 9px; color: {Theme.TEXT_MUTED}; font-weight: 600; letter-spacing: 1px; }}
+    QLabel#goalValue {{ font-size: 18px; font-weight: 700; color: {Theme.TEXT_PRIMARY}; }}
+    QLabel#todayFocus {{ font-size: 28px; font-weight: 800; color: {Theme.ACCENT}; }}
+    QLabel#hint {{ font-size: 10px; color: {Theme.TEXT_MUTED}; }}
+    QLabel#caption {{ font-size: 9px; color: {Theme.TEXT_MUTED}; }}
+    QLabel#captionAccent {{ font-size: 9px; color: {Theme.ACCENT}; }}
+    QLabel#settingLabel {{ font-size: 12px; color: {Theme.TEXT_SECONDARY}; font-weight: 500; }}
+    QLabel#workValue {{ font-size: 12px; color: {Theme.ACCENT}; font-weight: 600; min-width: 35px; }}
+    QLabel#breakValue {{ font-size: 12px; color: {Theme.SECONDARY}; font-weight: 600; min-width: 35px; }}
+    QLabel#quote {{
+        font-size: 11px;
+        font-style: italic;
+        color: {Theme.TEXT_SECONDARY};
+        padding: 8px;
+        background: {Theme.BG_ELEVATED};
+        border-radius: 10px;
+    }}
+    
+    QPushButton#preset {{
+        background: {Theme.BG_ELEVATED};
+        border: 1px solid {Theme.BG_HOVER};
+        border-radius: 14px;
+        color: {Theme.TEXT_MUTED};
+        font-size: 10px;
+        font-weight: 600;
+    }}
+    QPushButton#preset:hover {{
+        background: {Theme.BG_HOVER};
+        border-color: {Theme.ACCENT};
+        color: {Theme.ACCENT};
+    }}
+    QPushButton#editTime {{
+        background: {Theme.BG_ELEVATED};
+        border: 1px solid {Theme.BG_HOVER};
+        border-radius: 14px;
+        color: {Theme.TEXT_MUTED};
+        font-size: 12px;
+    }}
+    QPushButton#editTime:hover {{
+        background: {Theme.ACCENT};
+        color: {Theme.BG_DARKEST};
+    }}
+    QPushButton#apply {{
+        background: {Theme.ACCENT};
+        border: none;
+        border-radius: 8px;
+        color: {Theme.BG_DARKEST};
+        font-size: 11px;
+        font-weight: 600;
+    }}
+    QPushButton#apply:hover {{
+        background: {Theme.ACCENT_LIGHT};
+    }}
+    QPushButton#toggle {{
+        background: {Theme.BG_HOVER};
+        border: none;
+        border-radius: 13px;
+        color: {Theme.TEXT_MUTED};
+        font-size: 10px;
+        font-weight: 600;
+    }}
+    QPushButton#toggle:checked {{
+        background: {Theme.ACCENT};
+        color: {Theme.BG_DARKEST};
+    }}
+    
+    QSpinBox#minutesSpin {{
+        background: {Theme.BG_ELEVATED};
+        border: 1px solid {Theme.BG_HOVER};
+        border-radius: 8px;
+        color: {Theme.TEXT_PRIMARY};
+        padding: 4px 8px;
+        font-size: 12px;
+    }}
+    QSpinBox#minutesSpin::up-button, QSpinBox#minutesSpin::down-button {{
+        background: {Theme.BG_HOVER};
+        border: none;
+        width: 16px;
+    }}
+    QSpinBox#goalSpin {{
+        background: {Theme.BG_HOVER};
+        border: none;
+        border-radius: 6px;
+        color: {Theme.TEXT_PRIMARY};
+        padding: 2px 6px;
+        font-size: 10px;
+    }}
+    QSpinBox#goalSpin::up-button, QSpinBox#goalSpin::down-button {{
+        width: 12px;
+    }}
+    
+    QLineEdit#taskInput {{
+        background: transparent;
+        border: none;
+        color: {Theme.TEXT_PRIMARY};
+        font-size: 12px;
+        padding: 4px 0;
+    }}
+    QListView#taskList {{
+        background: transparent;
+        border: none;
+    }}
+"""
+
+# IconButton sets its own stylesheet, which beats the dashboard's, so the
+# accent add button still needs a widget-level override
+_ADD_BTN_STYLE = f"""
+    QPushButton {{
+        background: {Theme.ACCENT};
+        border: none;
+        border-radius: 15px;
+    }}
+    QPushButton:hover {{
+        background: {Theme.ACCENT_LIGHT};
+    }}
+"""
+
+
+def _mk_label(text: str, object_name: str, align=None, word_wrap: bool = False) -> QLabel:
+    """Create a dashboard label styled through _DASHBOARD_QSS by object name."""
+    label = QLabel(text)
+    label.setObjectName(object_name)
+    if align is not None:
+        label.setAlignment(align)
+    if word_wrap:
+        label.setWordWrap(True)
+    return label
+
+
+def _glyph_pixmap(glyph: str, pixel_size: int, color: str) -> QPixmap:
+    """Render a decorative glyph once and share it through QPixmapCache."""
+    ratio = QApplication.instance().devicePixelRatio()
+    key = f"glyph:{glyph}:{pixel_size}:{color}:{ratio}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+    
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    metrics = QFontMetrics(font)
+    width, height = metrics.horizontalAdvance(glyph), metrics.height()
+    
+    pixmap = QPixmap(int(width * ratio), int(height * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    painter.setFont(font)
+    painter.setPen(QColor(color))
+    painter.drawText(QRect(0, 0, width, height), Qt.AlignmentFlag.AlignCenter, glyph)
+    painter.end()
+    
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
 class DashboardWidget(QWidget):
     """Expanded dashboard view - Pure black with green accents."""
     
@@ -45,6 +249,24 @@ class DashboardWidget(QWidget):
     timer_duration_changed = Signal(int)  # New signal for editable timer
     daily_goal_changed = Signal(int)  # New signal for daily goal
     
+    # Pomodoro presets: (label, work minutes, break minutes)
+    PRESETS = (
+        ("25/5", 25, 5),
+        ("50/10", 50, 10),
+        ("90/20", 90, 20),
+    )
+    
+    TAB_TIMER, TAB_TASKS, TAB_STATS, TAB_SETTINGS = range(4)
+    TAB_NAMES = ("Timer", "Tasks", "Stats", "Settings")
+    DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+    TITLEBAR_HEIGHT = 50  # drags must start within this band at the top
+    
+    # Settings combo contents, with text -> row lookups for load_settings
+    ALARM_SOUNDS = ("Chime", "Bell", "Digital", "Gentle")
+    SEARCH_ENGINES = ("Google", "Brave", "DuckDuckGo", "Bing", "YouTube")
+    _ALARM_INDEX = {name.lower(): i for i, name in enumerate(ALARM_SOUNDS)}  # stored lowercase
+    _ENGINE_INDEX = {name: i for i, name in enumerate(SEARCH_ENGINES)}
+    
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
@@ -65,6 +287,25 @@ class DashboardWidget(QWidget):
         self._time_text = "25:00"
         self._progress = 0.0
         self._current_task: Optional[Task] = None
+        self._last_end_minute: Optional[int] = None
+        self._last_end_str = ""
+        self._last_goal: Optional[tuple] = None
+        
+        # Non-timer tabs are built on first view; updates that arrive
+        # before then are held and applied when the tab is built
+        self._tab_built = [True, False, False, False]
+        self._pending_tasks: Optional[List[Task]] = None
+        self._pending_stats: Optional[tuple] = None
+        self._pending_goal: Optional[tuple] = None
+        self._pending_settings: Optional[Settings] = None
+        
+        # Setting edits are collected per key and emitted once they settle,
+        # so dragging or flicking through options persists only the last value
+        self._dirty_settings: dict = {}
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(250)
+        self._settings_timer.timeout.connect(self.flush_settings)
         
         # Dragging
         self._drag_pos: Optional[QPoint] = None
@@ -74,6 +315,8 @@ class DashboardWidget(QWidget):
         self._setup_shortcuts()
     
     def _setup_ui(self):
+        self.setStyleSheet(_DASHBOARD_QSS)
+        
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(16, 12, 16, 16)
         main_layout.setSpacing(10)
@@ -84,39 +327,63 @@ class DashboardWidget(QWidget):
         
         # Tab widget with sleek styling
         self.tabs = QTabWidget()
-        self.tabs.setStyleSheet(f"""
-            QTabWidget::pane {{
-                border: none;
-                background: transparent;
-            }}
-            QTabBar::tab {{
-                background: transparent;
-                color: {Theme.TEXT_MUTED};
-                border: none;
-                padding: 8px 16px;
-                margin-right: 4px;
-                border-radius: 8px;
-                font-size: 11px;
-                font-weight: 600;
-            }}
-            QTabBar::tab:selected {{
-                background: {Theme.ACCENT};
-                color: {Theme.BG_DARKEST};
-            }}
-            QTabBar::tab:hover:!selected {{
-                background: rgba(255,255,255,0.05);
-                color: {Theme.TEXT_SECONDARY};
-            }}
-        """)
-        
-        # Tabs
-        self.tabs.addTab(self._create_timer_section(), "Timer")
-        self.tabs.addTab(self._create_tasks_section(), "Tasks")
-        self.tabs.addTab(self._create_stats_section(), "Stats")
-        self.tabs.addTab(self._create_settings_section(), "Settings")
+        self.tabs.setObjectName("dashboardTabs")
+        
+        # Tabs - only the timer is built up front, the rest are placeholders
+        self.tabs.addTab(self._create_timer_section(), self.TAB_NAMES[self.TAB_TIMER])
+        for name in self.TAB_NAMES[1:]:
+            self.tabs.addTab(QWidget(), name)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         main_layout.addWidget(self.tabs)
     
+    def _on_tab_changed(self, index: int):
+        """Build a tab the first time it is shown."""
+        self.flush_settings()
+        if index < 0 or self._tab_built[index]:
+            return
+        self._tab_built[index] = True
+        
+        builders = {
+            self.TAB_TASKS: self._create_tasks_section,
+            self.TAB_STATS: self._create_stats_section,
+            self.TAB_SETTINGS: self._create_settings_section,
+        }
+        self.tabs.blockSignals(True)
+        placeholder = self.tabs.widget(index)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, builders[index](), self.TAB_NAMES[index])
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        
+        # Replay the latest data received while the tab was a placeholder
+        if index == self.TAB_TASKS and self._pending_tasks is not None:
+            self.update_tasks_list(self._pending_tasks)
+            self._pending_tasks = None
+        elif index == self.TAB_STATS:
+            if self._pending_stats is not None:
+                self.update_stats(*self._pending_stats)
+                self._pending_stats = None
+            if self._pending_goal is not None:
+                self.update_daily_goal(*self._pending_goal)
+                self._pending_goal = None
+        elif index == self.TAB_SETTINGS and self._pending_settings is not None:
+            self.load_settings(self._pending_settings)
+            self._pending_settings = None
+    
+    def _set_duration(self, setting: str, minutes: int):
+        """Store a duration setting, moving its slider if the tab exists."""
+        if self._tab_built[self.TAB_SETTINGS]:
+            slider = (self.work_duration_slider if setting == "work_duration"
+                      else self.break_duration_slider)
+            slider.setValue(minutes)
+        else:
+            self._pending_settings = replace(
+                self._pending_settings or Settings(), **{setting: minutes}
+            )
+        self._mark_setting(setting, str(minutes))
+    
     def _create_header(self) -> QHBoxLayout:
         layout = QHBoxLayout()
         layout.setSpacing(8)
@@ -125,27 +392,17 @@ class DashboardWidget(QWidget):
         title_layout = QHBoxLayout()
         title_layout.setSpacing(6)
         
-        dot = QLabel("●")
-        dot.setStyleSheet(f"color: {Theme.ACCENT}; font-size: 8px;")
+        dot = QLabel()
+        dot.setPixmap(_glyph_pixmap("●", 8, Theme.ACCENT))
         title_layout.addWidget(dot)
         
-        title = QLabel("Focus")
-        title.setStyleSheet(f"""
-            font-size: 14px;
-            font-weight: 700;
-            color: {Theme.TEXT_PRIMARY};
-        """)
+        title = _mk_label("Focus", "title")
         title_layout.addWidget(title)
         
         layout.addLayout(title_layout)
         
         # Weather display
-        self.weather_label = QLabel("")
-        self.weather_label.setStyleSheet(f"""
-            font-size: 10px;
-            color: {Theme.TEXT_MUTED};
-            margin-left: 8px;
-        """)
+        self.weather_label = _mk_label("", "weather")
         layout.addWidget(self.weather_label)
         
         layout.addStretch()
@@ -153,13 +410,13 @@ class DashboardWidget(QWidget):
         # Fullscreen button
         self.fullscreen_btn = IconButton("expand", 24)
         self.fullscreen_btn.setToolTip("Fullscreen (F11)")
-        self.fullscreen_btn.clicked.connect(self.fullscreen_requested.emit)
+        self.fullscreen_btn.clicked.connect(self.fullscreen_requested)
         layout.addWidget(self.fullscreen_btn)
         
         # Collapse button
         self.collapse_btn = IconButton("collapse", 24)
         self.collapse_btn.setToolTip("Collapse")
-        self.collapse_btn.clicked.connect(self.collapse_requested.emit)
+        self.collapse_btn.clicked.connect(self.collapse_requested)
         layout.addWidget(self.collapse_btn)
         
         return layout
@@ -174,30 +431,19 @@ class DashboardWidget(QWidget):
         timer_container = QVBoxLayout()
         timer_container.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        self.progress_circle = CircularProgress(130)
+        self.progress_circle = CircularProgress(130, cached=True)
         timer_container.addWidget(self.progress_circle, alignment=Qt.AlignmentFlag.AlignCenter)
         
         # Time label (clickable to edit)
-        self.timer_label = QLabel(self._time_text)
-        self.timer_label.setStyleSheet(f"""
-            font-size: 42px;
-            font-weight: 800;
-            color: {Theme.TEXT_PRIMARY};
-            letter-spacing: 2px;
-        """)
-        self.timer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.timer_label = TimerDisplay(self._time_text, 42)
         timer_container.addWidget(self.timer_label)
         
         # End time label - shows when timer will end
-        self.end_time_label = QLabel("")
-        self.end_time_label.setStyleSheet(f"font-size: 10px; color: {Theme.TEXT_MUTED};")
-        self.end_time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.end_time_label = _mk_label("", "hint", align=Qt.AlignmentFlag.AlignCenter)
         timer_container.addWidget(self.end_time_label)
         
         # Status
-        self.status_label = QLabel("Ready to focus")
-        self.status_label.setStyleSheet(f"font-size: 11px; color: {Theme.TEXT_MUTED}; font-weight: 500;")
-        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.status_label = _mk_label("Ready to focus", "status", align=Qt.AlignmentFlag.AlignCenter)
         timer_container.addWidget(self.status_label)
         
         layout.addLayout(timer_container)
@@ -207,52 +453,23 @@ class DashboardWidget(QWidget):
         presets_layout.setSpacing(6)
         presets_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        preset_configs = [
-            ("25/5", 25, 5),
-            ("50/10", 50, 10),
-            ("90/20", 90, 20),
-        ]
-        
-        for label, work, brk in preset_configs:
+        # One group routes every preset click through a single connection
+        self._preset_group = QButtonGroup(self)
+        for preset_id, (label, _, _) in enumerate(self.PRESETS):
             btn = QPushButton(label)
             btn.setFixedSize(55, 28)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: {Theme.BG_ELEVATED};
-                    border: 1px solid {Theme.BG_HOVER};
-                    border-radius: 14px;
-                    color: {Theme.TEXT_MUTED};
-                    font-size: 10px;
-                    font-weight: 600;
-                }}
-                QPushButton:hover {{
-                    background: {Theme.BG_HOVER};
-                    border-color: {Theme.ACCENT};
-                    color: {Theme.ACCENT};
-                }}
-            """)
-            btn.clicked.connect(lambda checked, w=work, b=brk: self._on_preset_clicked(w, b))
+            btn.setObjectName("preset")
+            self._preset_group.addButton(btn, preset_id)
             presets_layout.addWidget(btn)
+        self._preset_group.idClicked.connect(self._on_preset_id_clicked)
         
         # Custom time edit button
         self.edit_time_btn = QPushButton("✎")
         self.edit_time_btn.setFixedSize(28, 28)
         self.edit_time_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.edit_time_btn.setToolTip("Edit timer duration")
-        self.edit_time_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {Theme.BG_ELEVATED};
-                border: 1px solid {Theme.BG_HOVER};
-                border-radius: 14px;
-                color: {Theme.TEXT_MUTED};
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                background: {Theme.ACCENT};
-                color: {Theme.BG_DARKEST};
-            }}
-        """)
+        self.edit_time_btn.setObjectName("editTime")
         self.edit_time_btn.clicked.connect(self._show_time_editor)
         presets_layout.addWidget(self.edit_time_btn)
         
@@ -270,39 +487,13 @@ class DashboardWidget(QWidget):
         self.minutes_spin.setValue(25)
         self.minutes_spin.setSuffix(" min")
         self.minutes_spin.setFixedWidth(80)
-        self.minutes_spin.setStyleSheet(f"""
-            QSpinBox {{
-                background: {Theme.BG_ELEVATED};
-                border: 1px solid {Theme.BG_HOVER};
-                border-radius: 8px;
-                color: {Theme.TEXT_PRIMARY};
-                padding: 4px 8px;
-                font-size: 12px;
-            }}
-            QSpinBox::up-button, QSpinBox::down-button {{
-                background: {Theme.BG_HOVER};
-                border: none;
-                width: 16px;
-            }}
-        """)
+        self.minutes_spin.setObjectName("minutesSpin")
         editor_layout.addWidget(self.minutes_spin)
         
         apply_btn = QPushButton("Set")
         apply_btn.setFixedSize(40, 28)
         apply_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        apply_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {Theme.ACCENT};
-                border: none;
-                border-radius: 8px;
-                color: {Theme.BG_DARKEST};
-                font-size: 11px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background: {Theme.ACCENT_LIGHT};
-            }}
-        """)
+        apply_btn.setObjectName("apply")
         apply_btn.clicked.connect(self._apply_custom_time)
         editor_layout.addWidget(apply_btn)
         
@@ -310,19 +501,15 @@ class DashboardWidget(QWidget):
         
         # Current task pill
         task_pill = QWidget()
-        task_pill.setStyleSheet(f"""
-            background: {Theme.BG_ELEVATED};
-            border-radius: 12px;
-        """)
+        task_pill.setObjectName("pill")
         task_layout = QHBoxLayout(task_pill)
         task_layout.setContentsMargins(14, 8, 14, 8)
         
-        task_icon = QLabel("◉")
-        task_icon.setStyleSheet(f"color: {Theme.ACCENT}; font-size: 10px;")
+        task_icon = QLabel()
+        task_icon.setPixmap(_glyph_pixmap("◉", 10, Theme.ACCENT))
         task_layout.addWidget(task_icon)
         
-        self.current_task_label = QLabel("No task selected")
-        self.current_task_label.setStyleSheet(f"font-size: 11px; color: {Theme.TEXT_SECONDARY}; font-weight: 500;")
+        self.current_task_label = _mk_label("No task selected", "taskLabel")
         task_layout.addWidget(self.current_task_label)
         task_layout.addStretch()
         
@@ -335,16 +522,16 @@ class DashboardWidget(QWidget):
         
         self.reset_btn = IconButton("reset", 38)
         self.reset_btn.setToolTip("Reset")
-        self.reset_btn.clicked.connect(self.reset_clicked.emit)
+        self.reset_btn.clicked.connect(self.reset_clicked)
         controls.addWidget(self.reset_btn)
         
         self.play_btn = ControlButton("play", 52)
-        self.play_btn.clicked.connect(self.play_pause_clicked.emit)
+        self.play_btn.clicked.connect(self.play_pause_clicked)
         controls.addWidget(self.play_btn)
         
         self.skip_btn = IconButton("skip", 38)
         self.skip_btn.setToolTip("Skip")
-        self.skip_btn.clicked.connect(self.skip_clicked.emit)
+        self.skip_btn.clicked.connect(self.skip_clicked)
         controls.addWidget(self.skip_btn)
         
         layout.addLayout(controls)
@@ -356,22 +543,10 @@ class DashboardWidget(QWidget):
         quote_layout.setContentsMargins(8, 8, 8, 8)
         quote_layout.setSpacing(4)
         
-        self.quote_label = QLabel("")
-        self.quote_label.setWordWrap(True)
-        self.quote_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.quote_label.setStyleSheet(f"""
-            font-size: 11px;
-            font-style: italic;
-            color: {Theme.TEXT_SECONDARY};
-            padding: 8px;
-            background: {Theme.BG_ELEVATED};
-            border-radius: 10px;
-        """)
+        self.quote_label = _mk_label("", "quote", align=Qt.AlignmentFlag.AlignCenter, word_wrap=True)
         quote_layout.addWidget(self.quote_label)
         
-        self.quote_author = QLabel("")
-        self.quote_author.setAlignment(Qt.AlignmentFlag.AlignRight)
-        self.quote_author.setStyleSheet(f"font-size: 9px; color: {Theme.TEXT_MUTED};")
+        self.quote_author = _mk_label("", "caption", align=Qt.AlignmentFlag.AlignRight)
         quote_layout.addWidget(self.quote_author)
         
         layout.addWidget(self.quote_widget)
@@ -380,12 +555,14 @@ class DashboardWidget(QWidget):
         
         return widget
     
+    def _on_preset_id_clicked(self, preset_id: int):
+        _, work_mins, break_mins = self.PRESETS[preset_id]
+        self._on_preset_clicked(work_mins, break_mins)
+    
     def _on_preset_clicked(self, work_mins: int, break_mins: int):
         """Handle preset button click."""
-        self.work_duration_slider.setValue(work_mins)
-        self.break_duration_slider.setValue(break_mins)
-        self.setting_changed.emit("work_duration", str(work_mins))
-        self.setting_changed.emit("break_duration", str(break_mins))
+        self._set_duration("work_duration", work_mins)
+        self._set_duration("break_duration", break_mins)
         self.timer_duration_changed.emit(work_mins)
     
     def _show_time_editor(self):
@@ -395,18 +572,30 @@ class DashboardWidget(QWidget):
     def _apply_custom_time(self):
         """Apply custom time from spin box."""
         mins = self.minutes_spin.value()
-        self.work_duration_slider.setValue(mins)
-        self.setting_changed.emit("work_duration", str(mins))
+        self._set_duration("work_duration", mins)
         self.timer_duration_changed.emit(mins)
         self.time_editor_widget.setVisible(False)
     
     def update_end_time(self, remaining_seconds: int):
         """Update the end time display."""
+        # The label only shows minutes, so skip work until the end minute moves
+        end_ts = int(time.time()) + remaining_seconds
+        end_minute = end_ts // 60 if remaining_seconds > 0 else -1
+        if end_minute == self._last_end_minute:
+            return
+        self._last_end_minute = end_minute
+        
         if remaining_seconds > 0:
-            end_time = datetime.now() + timedelta(seconds=remaining_seconds)
-            self.end_time_label.setText(f"Ends at {end_time.strftime('%I:%M %p')}")
+            # Same output as strftime('%I:%M %p') without parsing a format string
+            lt = time.localtime(end_ts)
+            hour = lt.tm_hour % 12 or 12
+            ampm = "AM" if lt.tm_hour < 12 else "PM"
+            text = f"Ends at {hour:02d}:{lt.tm_min:02d} {ampm}"
         else:
-            self.end_time_label.setText("")
+            text = ""
+        if text != self._last_end_str:
+            self._last_end_str = text
+            self.end_time_label.setText(text)
     
     def show_quote(self, is_break: bool = False):
         """Show a motivational quote."""
@@ -431,58 +620,42 @@ class DashboardWidget(QWidget):
         
         # Add task input
         input_container = QWidget()
-        input_container.setStyleSheet(f"""
-            background: {Theme.BG_ELEVATED};
-            border-radius: 12px;
-        """)
+        input_container.setObjectName("pill")
         input_layout = QHBoxLayout(input_container)
         input_layout.setContentsMargins(12, 8, 8, 8)
         input_layout.setSpacing(8)
         
         self.task_input = QLineEdit()
         self.task_input.setPlaceholderText("Add a task...")
-        self.task_input.setStyleSheet(f"""
-            QLineEdit {{
-                background: transparent;
-                border: none;
-                color: {Theme.TEXT_PRIMARY};
-                font-size: 12px;
-                padding: 4px 0;
-            }}
-        """)
+        self.task_input.setObjectName("taskInput")
         self.task_input.returnPressed.connect(self._on_add_task)
         input_layout.addWidget(self.task_input)
         
         add_btn = IconButton("plus", 30)
-        add_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {Theme.ACCENT};
-                border: none;
-                border-radius: 15px;
-            }}
-            QPushButton:hover {{
-                background: {Theme.ACCENT_LIGHT};
-            }}
-        """)
+        add_btn.setStyleSheet(_ADD_BTN_STYLE)
         add_btn.clicked.connect(self._on_add_task)
         input_layout.addWidget(add_btn)
         
         layout.addWidget(input_container)
         
-        # Tasks list
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("QScrollArea { background: transparent; border: none; }")
-        
-        self.tasks_container = QWidget()
-        self.tasks_layout = QVBoxLayout(self.tasks_container)
-        self.tasks_layout.setContentsMargins(0, 0, 0, 0)
-        self.tasks_layout.setSpacing(6)
-        self.tasks_layout.addStretch()
-        
-        scroll.setWidget(self.tasks_container)
-        layout.addWidget(scroll)
+        # Tasks list - rows are painted by the delegate, not one widget each
+        self.task_model = TaskListModel(self)
+        self.task_delegate = TaskItemDelegate(self)
+        self.task_delegate.toggled.connect(self.task_toggled)
+        self.task_delegate.deleted.connect(self.task_deleted)
+        self.task_delegate.selected.connect(self.task_selected)
+        
+        self.task_view = QListView()
+        self.task_view.setObjectName("taskList")
+        self.task_view.setModel(self.task_model)
+        self.task_view.setItemDelegate(self.task_delegate)
+        self.task_view.setUniformItemSizes(True)
+        self.task_view.setMouseTracking(True)
+        self.task_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.task_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.task_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.task_view.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        layout.addWidget(self.task_view)
         
         return widget
     
@@ -494,43 +667,38 @@ class DashboardWidget(QWidget):
         
         # Daily goal card
         goal_card = QWidget()
-        goal_card.setStyleSheet(f"""
-            background: {Theme.BG_ELEVATED};
-            border-radius: 14px;
-        """)
+        goal_card.setObjectName("card")
         goal_layout = QVBoxLayout(goal_card)
         goal_layout.setContentsMargins(16, 12, 16, 12)
         goal_layout.setSpacing(8)
         
         goal_header = QHBoxLayout()
-        goal_title = QLabel("🎯 DAILY GOAL")
-        goal_title.setStyleSheet(f"font-size: 9px; color: {Theme.TEXT_MUTED}; font-weight: 600; letter-spacing: 1px;")
+        goal_header.setSpacing(4)
+        goal_icon = QLabel()
+        goal_icon.setPixmap(_glyph_pixmap("🎯", 10, Theme.TEXT_MUTED))
+        goal_header.addWidget(goal_icon)
+        goal_title = _mk_label("DAILY GOAL", "sectionTitle")
         goal_header.addWidget(goal_title)
         goal_header.addStretch()
         
-        self.streak_label = QLabel("🔥 0 day streak")
-        self.streak_label.setStyleSheet(f"font-size: 9px; color: {Theme.ACCENT};")
+        streak_icon = QLabel()
+        streak_icon.setPixmap(_glyph_pixmap("🔥", 10, Theme.ACCENT))
+        goal_header.addWidget(streak_icon)
+        self.streak_label = _mk_label("0 day streak", "captionAccent")
         goal_header.addWidget(self.streak_label)
         goal_layout.addLayout(goal_header)
         
         # Goal progress
-        self.goal_progress_label = QLabel("0 / 120 min")
-        self.goal_progress_label.setStyleSheet(f"font-size: 18px; font-weight: 700; color: {Theme.TEXT_PRIMARY};")
+        self.goal_progress_label = _mk_label("0 / 120 min", "goalValue")
         goal_layout.addWidget(self.goal_progress_label)
         
         # Progress bar
-        self.goal_progress_bar = QWidget()
-        self.goal_progress_bar.setFixedHeight(6)
-        self.goal_progress_bar.setStyleSheet(f"""
-            background: {Theme.BG_HOVER};
-            border-radius: 3px;
-        """)
+        self.goal_progress_bar = GoalProgressBar(6)
         goal_layout.addWidget(self.goal_progress_bar)
         
         # Goal setting row
         goal_set_row = QHBoxLayout()
-        goal_set_label = QLabel("Target:")
-        goal_set_label.setStyleSheet(f"font-size: 10px; color: {Theme.TEXT_MUTED};")
+        goal_set_label = _mk_label("Target:", "hint")
         goal_set_row.addWidget(goal_set_label)
         
         self.goal_spin = QSpinBox()
@@ -539,20 +707,8 @@ class DashboardWidget(QWidget):
         self.goal_spin.setSingleStep(15)
         self.goal_spin.setSuffix(" min")
         self.goal_spin.setFixedWidth(80)
-        self.goal_spin.setStyleSheet(f"""
-            QSpinBox {{
-                background: {Theme.BG_HOVER};
-                border: none;
-                border-radius: 6px;
-                color: {Theme.TEXT_PRIMARY};
-                padding: 2px 6px;
-                font-size: 10px;
-            }}
-            QSpinBox::up-button, QSpinBox::down-button {{
-                width: 12px;
-            }}
-        """)
-        self.goal_spin.valueChanged.connect(lambda v: self.daily_goal_changed.emit(v))
+        self.goal_spin.setObjectName("goalSpin")
+        self.goal_spin.valueChanged.connect(self.daily_goal_changed)
         goal_set_row.addWidget(self.goal_spin)
         goal_set_row.addStretch()
         goal_layout.addLayout(goal_set_row)
@@ -561,37 +717,29 @@ class DashboardWidget(QWidget):
         
         # Today's summary - clean card
         summary_card = QWidget()
-        summary_card.setStyleSheet(f"""
-            background: {Theme.BG_ELEVATED};
-            border-radius: 14px;
-        """)
+        summary_card.setObjectName("card")
         summary_layout = QVBoxLayout(summary_card)
         summary_layout.setContentsMargins(16, 14, 16, 14)
         summary_layout.setSpacing(4)
         
-        summary_title = QLabel("TODAY")
-        summary_title.setStyleSheet(f"font-size: 9px; color: {Theme.TEXT_MUTED}; font-weight: 600; letter-spacing: 1px;")
+        summary_title = _mk_label("TODAY", "sectionTitle")
         summary_layout.addWidget(summary_title)
         
-        self.today_focus_label = QLabel("0h 0m")
-        self.today_focus_label.setStyleSheet(f"font-size: 28px; font-weight: 800; color: {Theme.ACCENT};")
+        self.today_focus_label = _mk_label("0h 0m", "todayFocus")
         summary_layout.addWidget(self.today_focus_label)
         
-        self.today_sessions_label = QLabel("0 sessions completed")
-        self.today_sessions_label.setStyleSheet(f"font-size: 10px; color: {Theme.TEXT_MUTED};")
+        self.today_sessions_label = _mk_label("0 sessions completed", "hint")
         summary_layout.addWidget(self.today_sessions_label)
         
         layout.addWidget(summary_card)
         
         # Weekly chart header
         chart_header = QHBoxLayout()
-        chart_label = QLabel("LAST 7 DAYS")
-        chart_label.setStyleSheet(f"font-size: 9px; font-weight: 600; color: {Theme.TEXT_MUTED}; letter-spacing: 1px;")
+        chart_label = _mk_label("LAST 7 DAYS", "sectionTitle")
         chart_header.addWidget(chart_label)
         chart_header.addStretch()
         
-        self.total_focus_label = QLabel("0h total")
-        self.total_focus_label.setStyleSheet(f"font-size: 9px; color: {Theme.TEXT_MUTED};")
+        self.total_focus_label = _mk_label("0h total", "caption")
         chart_header.addWidget(self.total_focus_label)
         
         layout.addLayout(chart_header)
@@ -602,10 +750,12 @@ class DashboardWidget(QWidget):
         self.stats_layout.setContentsMargins(0, 0, 0, 0)
         self.stats_layout.setSpacing(4)
         
-        days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        for day in days:
-            bar = StatsBarWidget(day, 0, 8 * 3600)
+        # Build every bar first, then add them with updates suspended
+        self._stats_bars = [StatsBarWidget(day, 0, 8 * 3600) for day in self.DAY_NAMES]
+        self.stats_container.setUpdatesEnabled(False)
+        for bar in self._stats_bars:
             self.stats_layout.addWidget(bar)
+        self.stats_container.setUpdatesEnabled(True)
         
         layout.addWidget(self.stats_container)
         layout.addStretch()
@@ -613,210 +763,205 @@ class DashboardWidget(QWidget):
         return widget
     
     def _create_settings_section(self) -> QWidget:
+        # One flat grid instead of a layout tree per card; cards are plain
+        # frames spanning their rows, lowered behind the controls.
+        # Columns: padding | label | control | value | padding
         widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(0, 8, 0, 0)
-        layout.setSpacing(12)
+        grid = QGridLayout(widget)
+        grid.setContentsMargins(0, 8, 0, 0)
+        grid.setHorizontalSpacing(8)
+        grid.setVerticalSpacing(0)
+        grid.setColumnMinimumWidth(0, 8)
+        grid.setColumnMinimumWidth(4, 8)
+        grid.setColumnStretch(1, 1)
+        
+        row = 0
+        
+        def gap(height: int):
+            nonlocal row
+            grid.setRowMinimumHeight(row, height)
+            row += 1
+        
+        def card(first_row: int):
+            frame = QFrame()
+            frame.setObjectName("card")
+            grid.addWidget(frame, first_row, 0, row - first_row, 5)
+            frame.lower()
         
         # Timer settings card
-        timer_card = QWidget()
-        timer_card.setStyleSheet(f"background: {Theme.BG_ELEVATED}; border-radius: 14px;")
-        timer_layout = QVBoxLayout(timer_card)
-        timer_layout.setContentsMargins(16, 14, 16, 14)
-        timer_layout.setSpacing(14)
+        start = row
+        gap(14)
         
         # Work duration
-        work_row = QHBoxLayout()
-        work_label = QLabel("Work duration")
-        work_label.setStyleSheet(f"font-size: 12px; color: {Theme.TEXT_SECONDARY}; font-weight: 500;")
-        work_row.addWidget(work_label)
-        work_row.addStretch()
+        work_label = _mk_label("Work duration", "settingLabel")
+        grid.addWidget(work_label, row, 1)
         
         self.work_duration_slider = QSlider(Qt.Orientation.Horizontal)
         self.work_duration_slider.setRange(5, 60)
         self.work_duration_slider.setValue(25)
         self.work_duration_slider.setFixedWidth(100)
-        work_row.addWidget(self.work_duration_slider)
+        grid.addWidget(self.work_duration_slider, row, 2)
         
-        self.work_duration_label = QLabel("25m")
-        self.work_duration_label.setStyleSheet(f"font-size: 12px; color: {Theme.ACCENT}; font-weight: 600; min-width: 35px;")
-        work_row.addWidget(self.work_duration_label)
+        self.work_duration_label = _mk_label("25m", "workValue")
+        grid.addWidget(self.work_duration_label, row, 3)
         
         self.work_duration_slider.valueChanged.connect(
-            lambda v: self._on_slider_change("work_duration", v)
+            partial(self._on_slider_change, "work_duration")
         )
-        timer_layout.addLayout(work_row)
+        self.work_duration_slider.sliderReleased.connect(self.flush_settings)
+        row += 1
+        gap(14)
         
         # Break duration
-        break_row = QHBoxLayout()
-        break_label = QLabel("Break duration")
-        break_label.setStyleSheet(f"font-size: 12px; color: {Theme.TEXT_SECONDARY}; font-weight: 500;")
-        break_row.addWidget(break_label)
-        break_row.addStretch()
+        break_label = _mk_label("Break duration", "settingLabel")
+        grid.addWidget(break_label, row, 1)
         
         self.break_duration_slider = QSlider(Qt.Orientation.Horizontal)
         self.break_duration_slider.setRange(1, 30)
         self.break_duration_slider.setValue(5)
         self.break_duration_slider.setFixedWidth(100)
-        break_row.addWidget(self.break_duration_slider)
+        grid.addWidget(self.break_duration_slider, row, 2)
         
-        self.break_duration_label = QLabel("5m")
-        self.break_duration_label.setStyleSheet(f"font-size: 12px; color: {Theme.SECONDARY}; font-weight: 600; min-width: 35px;")
-        break_row.addWidget(self.break_duration_label)
+        self.break_duration_label = _mk_label("5m", "breakValue")
+        grid.addWidget(self.break_duration_label, row, 3)
         
         self.break_duration_slider.valueChanged.connect(
-            lambda v: self._on_slider_change("break_duration", v)
+            partial(self._on_slider_change, "break_duration")
         )
-        timer_layout.addLayout(break_row)
-        
-        layout.addWidget(timer_card)
+        self.break_duration_slider.sliderReleased.connect(self.flush_settings)
+        row += 1
+        gap(14)
+        card(start)
+        gap(12)
         
         # Sound settings card
-        sound_card = QWidget()
-        sound_card.setStyleSheet(f"background: {Theme.BG_ELEVATED}; border-radius: 14px;")
-        sound_layout = QHBoxLayout(sound_card)
-        sound_layout.setContentsMargins(16, 12, 16, 12)
+        start = row
+        gap(12)
         
-        alarm_label = QLabel("Alarm sound")
-        alarm_label.setStyleSheet(f"font-size: 12px; color: {Theme.TEXT_SECONDARY}; font-weight: 500;")
-        sound_layout.addWidget(alarm_label)
-        sound_layout.addStretch()
+        alarm_label = _mk_label("Alarm sound", "settingLabel")
+        grid.addWidget(alarm_label, row, 1)
         
         self.alarm_combo = QComboBox()
-        self.alarm_combo.addItems(["Chime", "Bell", "Digital", "Gentle"])
+        self.alarm_combo.addItems(self.ALARM_SOUNDS)
         self.alarm_combo.setFixedWidth(100)
-        self.alarm_combo.currentTextChanged.connect(
-            lambda v: self.setting_changed.emit("alarm_sound", v.lower())
-        )
-        sound_layout.addWidget(self.alarm_combo)
-        
-        layout.addWidget(sound_card)
+        self.alarm_combo.currentTextChanged.connect(self._on_alarm_changed)
+        grid.addWidget(self.alarm_combo, row, 2, 1, 2, Qt.AlignmentFlag.AlignRight)
+        row += 1
+        gap(12)
+        card(start)
+        gap(12)
         
         # Display settings card
-        display_card = QWidget()
-        display_card.setStyleSheet(f"background: {Theme.BG_ELEVATED}; border-radius: 14px;")
-        display_layout = QVBoxLayout(display_card)
-        display_layout.setContentsMargins(16, 14, 16, 14)
-        display_layout.setSpacing(12)
+        start = row
+        gap(14)
         
         # Desktop only mode toggle
-        desktop_row = QHBoxLayout()
-        desktop_label = QLabel("Show only on desktop")
-        desktop_label.setStyleSheet(f"font-size: 12px; color: {Theme.TEXT_SECONDARY}; font-weight: 500;")
-        desktop_row.addWidget(desktop_label)
-        desktop_row.addStretch()
+        desktop_label = _mk_label("Show only on desktop", "settingLabel")
+        grid.addWidget(desktop_label, row, 1)
         
         self.desktop_only_toggle = QPushButton("OFF")
         self.desktop_only_toggle.setCheckable(True)
         self.desktop_only_toggle.setFixedSize(50, 26)
-        self.desktop_only_toggle.setStyleSheet(f"""
-            QPushButton {{
-                background: {Theme.BG_HOVER};
-                border: none;
-                border-radius: 13px;
-                color: {Theme.TEXT_MUTED};
-                font-size: 10px;
-                font-weight: 600;
-            }}
-            QPushButton:checked {{
-                background: {Theme.ACCENT};
-                color: {Theme.BG_DARKEST};
-            }}
-        """)
+        self.desktop_only_toggle.setObjectName("toggle")
         self.desktop_only_toggle.clicked.connect(self._on_desktop_only_toggle)
-        desktop_row.addWidget(self.desktop_only_toggle)
-        display_layout.addLayout(desktop_row)
+        grid.addWidget(self.desktop_only_toggle, row, 2, 1, 2, Qt.AlignmentFlag.AlignRight)
+        row += 1
+        gap(12)
         
         # Desktop mode hint
-        desktop_hint = QLabel("Hide island when apps are focused")
-        desktop_hint.setStyleSheet(f"font-size: 9px; color: {Theme.TEXT_MUTED};")
-        display_layout.addWidget(desktop_hint)
-        
-        layout.addWidget(display_card)
+        desktop_hint = _mk_label("Hide island when apps are focused", "caption")
+        grid.addWidget(desktop_hint, row, 1, 1, 3)
+        row += 1
+        gap(14)
+        card(start)
+        gap(12)
         
         # Search settings card
-        search_card = QWidget()
-        search_card.setStyleSheet(f"background: {Theme.BG_ELEVATED}; border-radius: 14px;")
-        search_layout = QVBoxLayout(search_card)
-        search_layout.setContentsMargins(16, 14, 16, 14)
-        search_layout.setSpacing(10)
-        
-        search_row = QHBoxLayout()
-        search_label = QLabel("Quick search engine")
-        search_label.setStyleSheet(f"font-size: 12px; color: {Theme.TEXT_SECONDARY}; font-weight: 500;")
-        search_row.addWidget(search_label)
-        search_row.addStretch()
+        start = row
+        gap(14)
+        
+        search_label = _mk_label("Quick search engine", "settingLabel")
+        grid.addWidget(search_label, row, 1)
         
         self.search_engine_combo = QComboBox()
-        self.search_engine_combo.addItems(["Google", "Brave", "DuckDuckGo", "Bing", "YouTube"])
+        self.search_engine_combo.addItems(self.SEARCH_ENGINES)
         self.search_engine_combo.setFixedWidth(100)
-        self.search_engine_combo.currentTextChanged.connect(
-            lambda v: self.setting_changed.emit("search_engine", v)
-        )
-        search_row.addWidget(self.search_engine_combo)
-        search_layout.addLayout(search_row)
+        self.search_engine_combo.currentTextChanged.connect(self._on_search_engine_changed)
+        grid.addWidget(self.search_engine_combo, row, 2, 1, 2, Qt.AlignmentFlag.AlignRight)
+        row += 1
+        gap(10)
+        
+        search_hint = _mk_label("Click 🔍 on island for quick search", "captionAccent")
+        grid.addWidget(search_hint, row, 1, 1, 3)
+        row += 1
+        gap(14)
+        card(start)
+        gap(12)
         
-        search_hint = QLabel("Click 🔍 on island for quick search")
-        search_hint.setStyleSheet(f"font-size: 9px; color: {Theme.ACCENT};")
-        search_layout.addWidget(search_hint)
+        # Shortcuts info
+        start = row
+        gap(12)
         
-        layout.addWidget(search_card)
+        sc_title = _mk_label("SHORTCUTS", "sectionTitle")
+        grid.addWidget(sc_title, row, 1, 1, 3)
+        row += 1
+        gap(4)
         
-        # Shortcuts info
-        shortcuts_card = QWidget()
-        shortcuts_card.setStyleSheet(f"background: {Theme.BG_ELEVATED}; border-radius: 14px;")
-        sc_layout = QVBoxLayout(shortcuts_card)
-        sc_layout.setContentsMargins(16, 12, 16, 12)
-        sc_layout.setSpacing(4)
-        
-        sc_title = QLabel("SHORTCUTS")
-        sc_title.setStyleSheet(f"font-size: 9px; color: {Theme.TEXT_MUTED}; font-weight: 600; letter-spacing: 1px;")
-        sc_layout.addWidget(sc_title)
-        
-        sc_info = QLabel("Space: Play/Pause  •  R: Reset  •  Esc: Collapse")
-        sc_info.setStyleSheet(f"font-size: 10px; color: {Theme.TEXT_MUTED};")
-        sc_info.setWordWrap(True)
-        sc_layout.addWidget(sc_info)
-        
-        layout.addWidget(shortcuts_card)
-        layout.addStretch()
+        sc_info = _mk_label("Space: Play/Pause  •  R: Reset  •  Esc: Collapse", "hint", word_wrap=True)
+        grid.addWidget(sc_info, row, 1, 1, 3)
+        row += 1
+        gap(12)
+        card(start)
+        
+        grid.setRowStretch(row, 1)
         
         return widget
     
     def _setup_shortcuts(self):
         space = QShortcut(QKeySequence(Qt.Key.Key_Space), self)
-        space.activated.connect(self.play_pause_clicked.emit)
+        space.activated.connect(self.play_pause_clicked)
         
         r = QShortcut(QKeySequence(Qt.Key.Key_R), self)
-        r.activated.connect(self.reset_clicked.emit)
+        r.activated.connect(self.reset_clicked)
         
         esc = QShortcut(QKeySequence(Qt.Key.Key_Escape), self)
-        esc.activated.connect(self.collapse_requested.emit)
+        esc.activated.connect(self.collapse_requested)
     
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Perfect rounded rect
-        path = QPainterPath()
-        path.addRoundedRect(0, 0, self.width(), self.height(),
-                           self._radius, self._radius)
-        
-        # Pure black background
-        painter.fillPath(path, QColor(0, 0, 0, 255))
+        # Pure black rounded rect, drawn directly rather than via a path
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 255))
+        painter.drawRoundedRect(0, 0, self.width(), self.height(),
+                                self._radius, self._radius)
         
         painter.end()
     
+    def focusOutEvent(self, event):
+        self.flush_settings()
+        super().focusOutEvent(event)
+    
+    def hideEvent(self, event):
+        self.flush_settings()
+        super().hideEvent(event)
+    
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             self._drag_pos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
             self._is_dragging = False
     
     def mouseMoveEvent(self, event):
-        if event.buttons() == Qt.MouseButton.LeftButton and self._drag_pos:
-            if event.pos().y() < 50:
-                self._is_dragging = True
-                self.move(event.globalPosition().toPoint() - self._drag_pos)
+        if event.buttons() != Qt.MouseButton.LeftButton or not self._drag_pos:
+            return
+        # Only the first move is checked against the title bar; once a drag
+        # has started it follows the cursor without re-testing
+        if not self._is_dragging:
+            if event.position().y() >= self.TITLEBAR_HEIGHT:
+                return
+            self._is_dragging = True
+        self.move(event.globalPosition().toPoint() - self._drag_pos)
     
     def mouseReleaseEvent(self, event):
         self._drag_pos = None
@@ -833,21 +978,41 @@ class DashboardWidget(QWidget):
             self.work_duration_label.setText(f"{value}m")
         elif setting == "break_duration":
             self.break_duration_label.setText(f"{value}m")
-        self.setting_changed.emit(setting, str(value))
+        self._mark_setting(setting, str(value))
+    
+    def _mark_setting(self, key: str, value: str):
+        """Record a changed setting and restart the flush timer."""
+        self._dirty_settings[key] = value
+        self._settings_timer.start()
+    
+    def flush_settings(self):
+        """Emit setting_changed once for each setting edited since the last flush."""
+        self._settings_timer.stop()
+        dirty, self._dirty_settings = self._dirty_settings, {}
+        for key, value in dirty.items():
+            self.setting_changed.emit(key, value)
+    
+    def _on_alarm_changed(self, sound: str):
+        self._mark_setting("alarm_sound", sound.lower())
+    
+    def _on_search_engine_changed(self, engine: str):
+        self._mark_setting("search_engine", engine)
     
     def _on_desktop_only_toggle(self):
         """Handle desktop-only mode toggle."""
         is_enabled = self.desktop_only_toggle.isChecked()
         self.desktop_only_toggle.setText("ON" if is_enabled else "OFF")
-        self.setting_changed.emit("desktop_only_mode", str(is_enabled).lower())
+        self._mark_setting("desktop_only_mode", str(is_enabled).lower())
     
     # ============== Public Methods ==============
     
     def update_timer(self, time_text: str, progress: float, remaining_seconds: int = 0):
-        self._time_text = time_text
-        self._progress = progress
-        self.timer_label.setText(time_text)
-        self.progress_circle.set_progress(progress)
+        if time_text != self._time_text:
+            self._time_text = time_text
+            self.timer_label.set_time(time_text)
+        if progress_moved(self._progress, progress):
+            self._progress = progress
+            self.progress_circle.set_progress(progress)
         self.update_end_time(remaining_seconds)
     
     def set_running(self, is_running: bool):
@@ -865,22 +1030,12 @@ class DashboardWidget(QWidget):
         
         if is_break:
             self.status_label.setText("Break time")
-            self.timer_label.setStyleSheet(f"""
-                font-size: 42px;
-                font-weight: 800;
-                color: {Theme.BREAK_COLOR};
-                letter-spacing: 2px;
-            """)
+            self.timer_label.set_break_mode(True)
             # Show a break quote
             self.show_quote(is_break=True)
         else:
             self.status_label.setText("Ready")
-            self.timer_label.setStyleSheet(f"""
-                font-size: 42px;
-                font-weight: 800;
-                color: {Theme.TEXT_PRIMARY};
-                letter-spacing: 2px;
-            """)
+            self.timer_label.set_break_mode(False)
             self.hide_quote()
     
     def set_current_task(self, task: Optional[Task]):
@@ -891,75 +1046,84 @@ class DashboardWidget(QWidget):
             self.current_task_label.setText("No task selected")
     
     def update_tasks_list(self, tasks: List[Task]):
-        while self.tasks_layout.count() > 1:
-            item = self.tasks_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        for task in tasks:
-            item = TaskItemWidget(
-                task.id, task.name, task.completed, 
-                task.total_focus_seconds
-            )
-            item.toggled.connect(self.task_toggled.emit)
-            item.deleted.connect(self.task_deleted.emit)
-            item.selected.connect(self.task_selected.emit)
-            self.tasks_layout.insertWidget(self.tasks_layout.count() - 1, item)
+        if not self._tab_built[self.TAB_TASKS]:
+            self._pending_tasks = tasks
+            return
+        
+        self.task_model.set_tasks(tasks)
     
     def update_stats(self, today: DailyStats, weekly: List[DailyStats], total: dict):
+        if not self._tab_built[self.TAB_STATS]:
+            self._pending_stats = (today, weekly, total)
+            return
+        
         hours = today.total_focus_seconds // 3600
         minutes = (today.total_focus_seconds % 3600) // 60
         self.today_focus_label.setText(f"{hours}h {minutes}m")
         self.today_sessions_label.setText(f"{today.sessions_completed} sessions completed")
         
-        while self.stats_layout.count() > 0:
-            item = self.stats_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        max_seconds = max((s.total_focus_seconds for s in weekly), default=3600)
-        max_seconds = max(max_seconds, 3600)
-        
-        day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        for stat in weekly:
-            try:
-                from datetime import datetime
-                dt = datetime.fromisoformat(stat.date)
-                day_name = day_names[dt.weekday()]
-            except:
-                day_name = stat.date[-2:]
-            
-            bar = StatsBarWidget(day_name, stat.total_focus_seconds, max_seconds)
-            self.stats_layout.addWidget(bar)
+        labels = [self.DAY_NAMES[stat.weekday] for stat in weekly]
+        self.update_week(labels, [s.total_focus_seconds for s in weekly])
         
         total_hours = total.get('total_focus_seconds', 0) // 3600
         self.total_focus_label.setText(f"{total_hours}h total")
     
-    def load_settings(self, settings: dict):
-        work_duration = int(settings.get('work_duration', 25))
-        break_duration = int(settings.get('break_duration', 5))
-        alarm_sound = settings.get('alarm_sound', 'chime')
-        desktop_only = settings.get('desktop_only_mode', 'false').lower() == 'true'
-        search_engine = settings.get('search_engine', 'Google')
-        
-        self.work_duration_slider.setValue(work_duration)
-        self.work_duration_label.setText(f"{work_duration}m")
-        
-        self.break_duration_slider.setValue(break_duration)
-        self.break_duration_label.setText(f"{break_duration}m")
-        
-        index = self.alarm_combo.findText(alarm_sound.capitalize())
-        if index >= 0:
-            self.alarm_combo.setCurrentIndex(index)
-        
-        # Load desktop-only mode
-        self.desktop_only_toggle.setChecked(desktop_only)
-        self.desktop_only_toggle.setText("ON" if desktop_only else "OFF")
-        
-        # Load search engine
-        search_index = self.search_engine_combo.findText(search_engine)
-        if search_index >= 0:
-            self.search_engine_combo.setCurrentIndex(search_index)
+    def update_week(self, labels: List[str], seconds_per_day: List[int]):
+        """Update every weekly bar in one pass, with container repaints held off."""
+        max_seconds = max(max(seconds_per_day, default=0), 3600)
+        
+        self.stats_container.setUpdatesEnabled(False)
+        for i, (label, seconds) in enumerate(zip(labels, seconds_per_day)):
+            # Reuse the existing bars; only grow the list if more days arrive
+            if i < len(self._stats_bars):
+                self._stats_bars[i].set_values(label, seconds, max_seconds)
+            else:
+                bar = StatsBarWidget(label, seconds, max_seconds)
+                self._stats_bars.append(bar)
+                self.stats_layout.addWidget(bar)
+        
+        for bar in self._stats_bars[len(labels):]:
+            bar.deleteLater()
+        del self._stats_bars[len(labels):]
+        self.stats_container.setUpdatesEnabled(True)
+    
+    def load_settings(self, settings: Settings):
+        if not self._tab_built[self.TAB_SETTINGS]:
+            self._pending_settings = settings
+            return
+        
+        work_duration = settings.work_duration
+        break_duration = settings.break_duration
+        alarm_sound = settings.alarm_sound
+        desktop_only = settings.desktop_only_mode
+        search_engine = settings.search_engine
+        
+        # These values came from the database; keep the controls' change
+        # handlers from queueing them straight back as edits
+        with ExitStack() as stack:
+            for control in (self.work_duration_slider, self.break_duration_slider,
+                            self.alarm_combo, self.desktop_only_toggle,
+                            self.search_engine_combo):
+                stack.enter_context(QSignalBlocker(control))
+            
+            self.work_duration_slider.setValue(work_duration)
+            self.work_duration_label.setText(f"{work_duration}m")
+            
+            self.break_duration_slider.setValue(break_duration)
+            self.break_duration_label.setText(f"{break_duration}m")
+            
+            index = self._ALARM_INDEX.get(alarm_sound, -1)
+            if index >= 0:
+                self.alarm_combo.setCurrentIndex(index)
+            
+            # Load desktop-only mode
+            self.desktop_only_toggle.setChecked(desktop_only)
+            self.desktop_only_toggle.setText("ON" if desktop_only else "OFF")
+            
+            # Load search engine
+            search_index = self._ENGINE_INDEX.get(search_engine, -1)
+            if search_index >= 0:
+                self.search_engine_combo.setCurrentIndex(search_index)
     
     def get_geometry(self) -> QRect:
         return self.geometry()
@@ -971,20 +1135,20 @@ class DashboardWidget(QWidget):
     
     def update_daily_goal(self, goal: DailyGoal, streak: int = 0):
         """Update the daily goal display."""
+        if not self._tab_built[self.TAB_STATS]:
+            self._pending_goal = (goal, streak)
+            return
+        
+        # Stats refresh after every session and task change; the goal row
+        # only needs touching when one of its displayed values moved
+        key = (goal.achieved_minutes, goal.target_minutes, streak)
+        if key == self._last_goal:
+            return
+        self._last_goal = key
+        
         self.goal_progress_label.setText(f"{goal.achieved_minutes} / {goal.target_minutes} min")
-        self.streak_label.setText(f"🔥 {streak} day streak")
-        self.goal_spin.setValue(goal.target_minutes)
-        
-        # Update progress bar with gradient fill
-        progress_pct = min(goal.progress * 100, 100)
-        color = Theme.ACCENT if goal.is_achieved else Theme.SECONDARY
-        self.goal_progress_bar.setStyleSheet(f"""
-            background: qlineargradient(
-                x1:0, y1:0, x2:1, y2:0,
-                stop:0 {color},
-                stop:{progress_pct/100} {color},
-                stop:{progress_pct/100 + 0.001} {Theme.BG_HOVER},
-                stop:1 {Theme.BG_HOVER}
-            );
-            border-radius: 3px;
-        """)
+        self.streak_label.setText(f"{streak} day streak")
+        with QSignalBlocker(self.goal_spin):
+            self.goal_spin.setValue(goal.target_minutes)
+        
+        self.goal_progress_bar.set_progress(goal.progress, goal.is_achieved)
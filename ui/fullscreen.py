@@ -83,7 +83,7 @@ class FullscreenMode(QWidget):
                 color: {Theme.TEXT_PRIMARY};
             }}
         """)
-        self.close_btn.clicked.connect(self.close_requested.emit)
+        self.close_btn.clicked.connect(self.close_requested)
         top_bar.addWidget(self.close_btn)
         
         layout.addLayout(top_bar)
@@ -195,11 +195,11 @@ class FullscreenMode(QWidget):
     def _setup_shortcuts(self):
         # ESC to close
         esc = QShortcut(QKeySequence(Qt.Key.Key_Escape), self)
-        esc.activated.connect(self.close_requested.emit)
+        esc.activated.connect(self.close_requested)
         
         # Space for play/pause
         space = QShortcut(QKeySequence(Qt.Key.Key_Space), self)
-        space.activated.connect(self.play_pause_clicked.emit)
+        space.activated.connect(self.play_pause_clicked)
     
     def _update_clock(self):
         now = datetime.now()
@@ -259,9 +259,10 @@ class FullscreenMode(QWidget):
     # ============== Public Methods ==============
     
     def update_timer(self, time_text: str, progress: float):
-        self._time_text = time_text
         self._progress = progress
-        self.timer_display.setText(time_text)
+        if time_text != self._time_text:
+            self._time_text = time_text
+            self.timer_display.setText(time_text)
     
     def set_running(self, is_running: bool):
         self._is_running = is_running
@@ -5,7 +5,7 @@ Pure black with green accent - Dynamic Island style.
 
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QLabel, QVBoxLayout,
-    QGraphicsDropShadowEffect, QApplication
+    QApplication
 )
 from PySide6.QtCore import (
     Qt, Signal, QPoint, QPropertyAnimation, QEasingCurve, 
@@ -17,7 +17,7 @@ from PySide6.QtGui import (
 )
 from typing import Optional
 
-from ui.components import MiniCircularProgress, IconButton
+from ui.components import MiniCircularProgress, IconButton, progress_moved
 from ui.styles import Theme
 
 
@@ -196,10 +196,12 @@ class MiniIslandWidget(QWidget):
     # ============== Public Methods ==============
     
     def update_timer(self, time_text: str, progress: float):
-        self._time_text = time_text
-        self._progress = progress
-        self.timer_label.setText(time_text)
-        self.progress_circle.set_progress(progress)
+        if time_text != self._time_text:
+            self._time_text = time_text
+            self.timer_label.setText(time_text)
+        if progress_moved(self._progress, progress):
+            self._progress = progress
+            self.progress_circle.set_progress(progress)
     
     def update_task(self, task_name: str):
         self._task_name = task_name
@@ -5,15 +5,18 @@ Spotlight/Alfred style quick search that opens in browser.
 
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLineEdit, QLabel,
-    QListWidget, QListWidgetItem, QApplication
+    QListView, QApplication
 )
 from PySide6.QtCore import (
-    Qt, Signal, QPropertyAnimation, QEasingCurve, Property, QTimer
+    Qt, Signal, QPropertyAnimation, QEasingCurve, Property, QTimer,
+    QStringListModel, QModelIndex, QStandardPaths
 )
 from PySide6.QtGui import (
     QColor, QPainter, QPainterPath, QKeySequence, QShortcut, QFont
 )
-from typing import Optional
+from typing import Optional, List, Dict
+import json
+import os
 import webbrowser
 import urllib.parse
 
@@ -22,6 +25,62 @@ from ui.icons import IconPainter
 from ui.components import IconButton
 
 
+HISTORY_FILENAME = 'search_history.json'
+IMAGES_SEARCH_URL = "https://www.google.com/search?tbm=isch&q="
+
+# Query values are form-encoded (spaces as '+'), which every engine accepts
+_quote = urllib.parse.quote_plus
+_open_url = webbrowser.open
+
+# Stylesheets are built once at import; Theme values never change at runtime
+_SEARCH_INPUT_QSS = f"""
+    QLineEdit {{
+        background: transparent;
+        border: none;
+        color: {Theme.TEXT_PRIMARY};
+        font-size: 18px;
+        font-weight: 500;
+        padding: 4px 0;
+    }}
+    QLineEdit::placeholder {{
+        color: {Theme.TEXT_MUTED};
+    }}
+"""
+_ENGINE_LABEL_QSS = f"""
+    font-size: 11px;
+    color: {Theme.ACCENT};
+    font-weight: 600;
+    padding: 4px 10px;
+    background: {Theme.ACCENT_MUTED};
+    border-radius: 8px;
+"""
+_SUGGESTIONS_QSS = f"""
+    QListView {{
+        background: transparent;
+        border: none;
+        outline: none;
+    }}
+    QListView::item {{
+        color: {Theme.TEXT_SECONDARY};
+        padding: 8px 12px;
+        border-radius: 8px;
+        margin: 2px 0;
+    }}
+    QListView::item:hover {{
+        background: {Theme.BG_HOVER};
+        color: {Theme.TEXT_PRIMARY};
+    }}
+    QListView::item:selected {{
+        background: {Theme.ACCENT_MUTED};
+        color: {Theme.ACCENT};
+    }}
+"""
+_HINTS_QSS = f"""
+    font-size: 9px;
+    color: {Theme.TEXT_MUTED};
+"""
+
+
 class SearchWidget(QWidget):
     """
     Quick search widget - Alt+Space activated.
@@ -38,6 +97,14 @@ class SearchWidget(QWidget):
         "Bing": "https://www.bing.com/search?q=",
         "YouTube": "https://www.youtube.com/results?search_query=",
     }
+    _ENGINE_NAMES = tuple(SEARCH_ENGINES)  # Tab cycling order
+    
+    _BG_COLOR = QColor(0, 0, 0, 250)
+    _BORDER_COLOR = QColor(255, 255, 255, 15)
+    
+    MAX_SUGGESTIONS = 5
+    MAX_HISTORY = 20
+    MAX_CACHED_QUERIES = 128
     
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
@@ -56,21 +123,47 @@ class SearchWidget(QWidget):
         self._radius = 16
         self._expanded_height = 200
         self._is_expanded = False
+        self._bg_path: Optional[QPainterPath] = None  # rebuilt on resize
         
         self.setFixedSize(self._width, self._height)
         
-        # Current search engine
+        # Current search engine and its position in _ENGINE_NAMES
         self._search_engine = "Google"
+        self._engine_idx = self._ENGINE_NAMES.index(self._search_engine)
+        
+        # Search history for suggestions, newest first, with a lowercased
+        # copy kept in step so matching never re-lowercases entries
+        self._search_history: List[str] = []
+        self._history_lower: List[str] = []
+        self._history_dirty = False
+        self._history_path = os.path.join(
+            QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation),
+            HISTORY_FILENAME
+        )
+        self._load_history()
         
-        # Search history for suggestions
-        self._search_history = []
+        # Suggestion rows per query; dropped whenever history or engine changes
+        self._suggestion_cache: Dict[str, List[str]] = {}
+        
+        # Suggestion row prefix (text before ':') -> query handler
+        self._suggestion_handlers = {
+            "YouTube": lambda query: self._search_with_query(query, "YouTube"),
+            "Images": self._search_images,
+        }
+        
+        # Suggestions are rebuilt once typing pauses, not on every keystroke
+        self._pending_query = ""
+        self._suggest_timer = QTimer(self)
+        self._suggest_timer.setSingleShot(True)
+        self._suggest_timer.setInterval(100)
+        self._suggest_timer.timeout.connect(self._flush_suggestions)
         
         self._setup_ui()
         self._setup_shortcuts()
         self._center_on_screen()
     
     def _setup_ui(self):
-        main_layout = QVBoxLayout(self)
+        self._main_layout = main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(16, 12, 16, 12)
         main_layout.setSpacing(8)
         
@@ -80,83 +173,48 @@ class SearchWidget(QWidget):
         
         # Search icon
         self.search_icon = QLabel("🔍")
-        self.search_icon.setStyleSheet(f"font-size: 18px;")
+        self.search_icon.setStyleSheet("font-size: 18px;")
         search_container.addWidget(self.search_icon)
         
         # Search input
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search the web...")
-        self.search_input.setStyleSheet(f"""
-            QLineEdit {{
-                background: transparent;
-                border: none;
-                color: {Theme.TEXT_PRIMARY};
-                font-size: 18px;
-                font-weight: 500;
-                padding: 4px 0;
-            }}
-            QLineEdit::placeholder {{
-                color: {Theme.TEXT_MUTED};
-            }}
-        """)
+        self.search_input.setStyleSheet(_SEARCH_INPUT_QSS)
         self.search_input.returnPressed.connect(self._perform_search)
         self.search_input.textChanged.connect(self._on_text_changed)
         search_container.addWidget(self.search_input, 1)
         
         # Search engine label
         self.engine_label = QLabel(f"↵ {self._search_engine}")
-        self.engine_label.setStyleSheet(f"""
-            font-size: 11px;
-            color: {Theme.ACCENT};
-            font-weight: 600;
-            padding: 4px 10px;
-            background: {Theme.ACCENT_MUTED};
-            border-radius: 8px;
-        """)
+        self.engine_label.setStyleSheet(_ENGINE_LABEL_QSS)
         self.engine_label.setCursor(Qt.CursorShape.PointingHandCursor)
         self.engine_label.mousePressEvent = self._cycle_search_engine
         search_container.addWidget(self.engine_label)
         
         main_layout.addLayout(search_container)
         
-        # Suggestions list (hidden initially)
-        self.suggestions_list = QListWidget()
-        self.suggestions_list.setStyleSheet(f"""
-            QListWidget {{
-                background: transparent;
-                border: none;
-                outline: none;
-            }}
-            QListWidget::item {{
-                color: {Theme.TEXT_SECONDARY};
-                padding: 8px 12px;
-                border-radius: 8px;
-                margin: 2px 0;
-            }}
-            QListWidget::item:hover {{
-                background: {Theme.BG_HOVER};
-                color: {Theme.TEXT_PRIMARY};
-            }}
-            QListWidget::item:selected {{
-                background: {Theme.ACCENT_MUTED};
-                color: {Theme.ACCENT};
-            }}
-        """)
+        # Suggestions model; its list view and the hints are built the first
+        # time suggestions are shown, since many searches never get that far
+        self._sugg_model = QStringListModel(self)
+        self.suggestions_list: Optional[QListView] = None
+        self.hints_label: Optional[QLabel] = None
+    
+    def _build_suggestions(self):
+        """Create the suggestions list and shortcut hints below the search bar."""
+        self.suggestions_list = QListView()
+        self.suggestions_list.setModel(self._sugg_model)
+        self.suggestions_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.suggestions_list.setStyleSheet(_SUGGESTIONS_QSS)
         self.suggestions_list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.suggestions_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.suggestions_list.itemClicked.connect(self._on_suggestion_clicked)
-        self.suggestions_list.hide()
-        main_layout.addWidget(self.suggestions_list)
+        self.suggestions_list.clicked.connect(self._on_suggestion_clicked)
+        self._main_layout.addWidget(self.suggestions_list)
         
         # Shortcut hints
         self.hints_label = QLabel("Tab: Switch Engine • Esc: Close • Enter: Search")
-        self.hints_label.setStyleSheet(f"""
-            font-size: 9px;
-            color: {Theme.TEXT_MUTED};
-        """)
+        self.hints_label.setStyleSheet(_HINTS_QSS)
         self.hints_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.hints_label.hide()
-        main_layout.addWidget(self.hints_label)
+        self._main_layout.addWidget(self.hints_label)
     
     def _setup_shortcuts(self):
         # Escape to close
@@ -186,44 +244,69 @@ class SearchWidget(QWidget):
         y = max(50, y)  # At least 50px from top
         self.move(x, y)
     
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._bg_path = None
+    
     def paintEvent(self, event):
+        # Rounded rectangle path, kept until the widget changes size
+        if self._bg_path is None:
+            self._bg_path = QPainterPath()
+            self._bg_path.addRoundedRect(0, 0, self.width(), self.height(),
+                                         self._radius, self._radius)
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Rounded rectangle path
-        path = QPainterPath()
-        path.addRoundedRect(0, 0, self.width(), self.height(),
-                           self._radius, self._radius)
-        
         # Pure black fill with slight transparency
-        painter.fillPath(path, QColor(0, 0, 0, 250))
+        painter.fillPath(self._bg_path, self._BG_COLOR)
         
         # Subtle border
-        painter.setPen(QColor(255, 255, 255, 15))
-        painter.drawPath(path)
+        painter.setPen(self._BORDER_COLOR)
+        painter.drawPath(self._bg_path)
         
         painter.end()
     
     def _cycle_search_engine(self, event=None):
         """Cycle through available search engines."""
-        engines = list(self.SEARCH_ENGINES.keys())
-        current_idx = engines.index(self._search_engine)
-        next_idx = (current_idx + 1) % len(engines)
-        self._search_engine = engines[next_idx]
+        self._engine_idx = (self._engine_idx + 1) % len(self._ENGINE_NAMES)
+        self._search_engine = self._ENGINE_NAMES[self._engine_idx]
         self.engine_label.setText(f"↵ {self._search_engine}")
+        self._suggestion_cache.clear()
     
     def _on_text_changed(self, text: str):
         """Handle text changes - show/hide suggestions."""
         if text:
             # Show suggestions based on history and common searches
-            self._update_suggestions(text)
+            self._pending_query = text
+            self._suggest_timer.start()
         else:
+            self._suggest_timer.stop()
             self._collapse_suggestions()
     
+    def _flush_suggestions(self):
+        """Build suggestions for the latest query now, if one is waiting."""
+        self._suggest_timer.stop()
+        if self._pending_query:
+            self._update_suggestions(self._pending_query)
+            self._pending_query = ""
+    
     def _update_suggestions(self, query: str):
         """Update suggestions list."""
-        self.suggestions_list.clear()
+        texts = self._suggestion_cache.get(query)
+        if texts is None:
+            if len(self._suggestion_cache) >= self.MAX_CACHED_QUERIES:
+                self._suggestion_cache.clear()
+            texts = self._suggestion_cache[query] = self._compute_suggestions(query)
+        
+        # One model reset replaces every row
+        self._sugg_model.setStringList(texts)
         
+        if texts:
+            self._expand_suggestions()
+    
+    def _compute_suggestions(self, query: str) -> List[str]:
+        """Build the suggestion row texts for a query."""
         # Quick search prefixes
         quick_searches = [
             f"Search {self._search_engine}: {query}",
@@ -231,22 +314,28 @@ class SearchWidget(QWidget):
             f"Images: {query}",
         ]
         
-        # Add items from history that match
-        for item in self._search_history:
-            if query.lower() in item.lower():
-                quick_searches.append(item)
+        # Fill the remaining rows from history: entries starting with the
+        # query rank above ones that merely contain it
+        room = self.MAX_SUGGESTIONS - len(quick_searches)
+        needle = query.lower()
+        prefix_hits, other_hits = [], []
+        for item, lower in zip(self._search_history, self._history_lower):
+            if lower.startswith(needle):
+                prefix_hits.append(item)
+                if len(prefix_hits) >= room:
+                    break
+            elif needle in lower:
+                other_hits.append(item)
+        quick_searches.extend((prefix_hits + other_hits)[:room])
         
-        for search in quick_searches[:5]:
-            item = QListWidgetItem(f"  {search}")
-            self.suggestions_list.addItem(item)
-        
-        if self.suggestions_list.count() > 0:
-            self._expand_suggestions()
+        return [f"  {search}" for search in quick_searches]
     
     def _expand_suggestions(self):
         """Expand to show suggestions."""
         if not self._is_expanded:
             self._is_expanded = True
+            if self.suggestions_list is None:
+                self._build_suggestions()
             self.suggestions_list.show()
             self.hints_label.show()
             self.setFixedHeight(self._expanded_height)
@@ -261,46 +350,50 @@ class SearchWidget(QWidget):
     
     def _select_next_suggestion(self):
         """Select next item in suggestions."""
-        if self.suggestions_list.isVisible():
-            current = self.suggestions_list.currentRow()
-            if current < self.suggestions_list.count() - 1:
-                self.suggestions_list.setCurrentRow(current + 1)
+        if self._is_expanded:
+            current = self.suggestions_list.currentIndex().row()
+            if current < self._sugg_model.rowCount() - 1:
+                self.suggestions_list.setCurrentIndex(self._sugg_model.index(current + 1))
     
     def _select_prev_suggestion(self):
         """Select previous item in suggestions."""
-        if self.suggestions_list.isVisible():
-            current = self.suggestions_list.currentRow()
+        if self._is_expanded:
+            current = self.suggestions_list.currentIndex().row()
             if current > 0:
-                self.suggestions_list.setCurrentRow(current - 1)
+                self.suggestions_list.setCurrentIndex(self._sugg_model.index(current - 1))
     
-    def _on_suggestion_clicked(self, item: QListWidgetItem):
+    def _on_suggestion_clicked(self, index: QModelIndex):
         """Handle suggestion click."""
-        text = item.text().strip()
+        text = index.data().strip()
         
-        # Parse the suggestion
-        if text.startswith("Search"):
-            # Use current engine
-            query = text.split(":", 1)[1].strip() if ":" in text else ""
-            self._search_with_query(query, self._search_engine)
-        elif text.startswith("YouTube:"):
-            query = text.split(":", 1)[1].strip()
-            self._search_with_query(query, "YouTube")
-        elif text.startswith("Images:"):
-            query = text.split(":", 1)[1].strip()
-            url = f"https://www.google.com/search?tbm=isch&q={urllib.parse.quote(query)}"
-            webbrowser.open(url)
-            self._close_widget()
+        # "YouTube: q" and "Images: q" rows dispatch on their exact prefix and
+        # "Search <engine>: q" uses the current engine; anything else is a
+        # history entry searched as-is
+        prefix, sep, rest = text.partition(":")
+        handler = self._suggestion_handlers.get(prefix) if sep else None
+        if handler is not None:
+            handler(rest.strip())
+        elif sep and prefix.startswith("Search "):
+            self._search_with_query(rest.strip(), self._search_engine)
         else:
-            # Direct search
             self._search_with_query(text, self._search_engine)
     
+    def _search_images(self, query: str):
+        """Open a Google Images search."""
+        _open_url(IMAGES_SEARCH_URL + _quote(query))
+        self._close_widget()
+    
     def _perform_search(self):
         """Perform search with current input."""
         query = self.search_input.text().strip()
         if query:
+            # Don't act on a selection left over from an earlier query
+            if self._suggest_timer.isActive():
+                self._flush_suggestions()
             # Check if selected suggestion
-            if self.suggestions_list.currentItem():
-                self._on_suggestion_clicked(self.suggestions_list.currentItem())
+            current = self.suggestions_list.currentIndex() if self._is_expanded else None
+            if current is not None and current.isValid():
+                self._on_suggestion_clicked(current)
             else:
                 self._search_with_query(query, self._search_engine)
     
@@ -310,17 +403,52 @@ class SearchWidget(QWidget):
             # Add to history
             if query not in self._search_history:
                 self._search_history.insert(0, query)
-                self._search_history = self._search_history[:20]  # Keep last 20
+                self._history_lower.insert(0, query.lower())
+                del self._search_history[self.MAX_HISTORY:]
+                del self._history_lower[self.MAX_HISTORY:]
+                self._history_dirty = True
+                self._suggestion_cache.clear()
             
             # Build URL
             base_url = self.SEARCH_ENGINES.get(engine, self.SEARCH_ENGINES["Google"])
-            url = base_url + urllib.parse.quote(query)
+            url = base_url + _quote(query)
             
             # Open in default browser
-            webbrowser.open(url)
+            _open_url(url)
             
             self._close_widget()
     
+    def _load_history(self):
+        """Load saved search history, ignoring a missing or corrupt file."""
+        try:
+            with open(self._history_path, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(history, list):
+            return
+        self._search_history = [q for q in history if isinstance(q, str)][:self.MAX_HISTORY]
+        self._history_lower = [q.lower() for q in self._search_history]
+    
+    def _save_history(self):
+        """Write the history to disk if it changed since the last save."""
+        if not self._history_dirty:
+            return
+        self._history_dirty = False
+        try:
+            os.makedirs(os.path.dirname(self._history_path), exist_ok=True)
+            tmp_path = self._history_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._search_history, f)
+            os.replace(tmp_path, self._history_path)
+        except OSError as e:
+            print(f"Failed to save search history: {e}")
+    
+    def hideEvent(self, event):
+        # Searches close the widget, so this saves once per search session
+        self._save_history()
+        super().hideEvent(event)
+    
     def _close_widget(self):
         """Close the search widget."""
         self.search_input.clear()
@@ -341,7 +469,9 @@ class SearchWidget(QWidget):
         """Set the default search engine."""
         if engine in self.SEARCH_ENGINES:
             self._search_engine = engine
+            self._engine_idx = self._ENGINE_NAMES.index(engine)
             self.engine_label.setText(f"↵ {self._search_engine}")
+            self._suggestion_cache.clear()
     
     def get_search_engine(self) -> str:
         """Get current search engine."""